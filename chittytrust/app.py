@@ -1,12 +1,29 @@
 import os
 import logging
-from flask import Flask, render_template, jsonify, request, session, redirect, url_for
+from flask import Flask, Response, render_template, jsonify, request, session, redirect, url_for, stream_with_context, g
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+from flask_compress import Compress
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import func, case, text
 from werkzeug.middleware.proxy_fix import ProxyFix
-from datetime import datetime
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from bisect import bisect_right
+from collections import Counter
 import asyncio
+import decimal
+import hashlib
+import json
+import multiprocessing
+import secrets
+import threading
+import time
 import requests
 import jwt
+import orjson
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -22,35 +39,112 @@ except Exception as e:
     def send_event(event_type, data=None):
         pass
 
+# Shared event loop for async trust and ledger calls made from request threads;
+# uses libuv via uvloop where it is installed
+try:
+    import uvloop
+    event_loop = uvloop.new_event_loop()
+except ImportError:
+    event_loop = asyncio.new_event_loop()
+threading.Thread(target=event_loop.run_forever, name='chitty-event-loop', daemon=True).start()
+
+# Longest a request thread waits on the shared loop before giving up on the coroutine
+RUN_ASYNC_TIMEOUT = 30
+
+def run_async(coro, timeout: float = RUN_ASYNC_TIMEOUT):
+    """Run a coroutine on the shared event loop and wait for its result."""
+    future = asyncio.run_coroutine_threadsafe(coro, event_loop)
+    try:
+        return future.result(timeout=timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
 # Import our trust engine
 from src.chitty_trust import calculate_trust
-from src.chitty_trust.analytics import TrustAnalytics
-from src.chitty_trust.visualization import TrustVisualizationEngine
-from demo_data import get_persona_data
+from demo_data import get_persona_data, get_personas_bulk
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson."""
+    
+    # Datetimes are encoded natively in the same ISO form isoformat() gives
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    mimetype = 'application/json'
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_json_default, option=self.options).decode()
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of round-tripping through str
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_json_default, option=self.options)
+        return self._app.response_class(body, mimetype=self.mimetype)
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def _json_default(obj):
+    """Encode the types Flask's default provider handles that orjson doesn't."""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = os.environ.get("SESSION_SECRET", "chitty-trust-demo-key")
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 
-# Database configuration
-app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
-    "pool_recycle": 300,
-    "pool_pre_ping": True,
-}
+# Compress JSON and page responses; short payloads such as transaction ids stay uncompressed
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 1024
+app.config["COMPRESS_LEVEL"] = 4
+app.config["COMPRESS_BR_LEVEL"] = 4
+Compress(app)
+
+# Response cache for read-mostly routes; Redis shares entries across workers
+app.config["CACHE_TYPE"] = "RedisCache" if os.environ.get("REDIS_URL") else "SimpleCache"
+app.config["CACHE_REDIS_URL"] = os.environ.get("REDIS_URL")
+app.config["CACHE_DEFAULT_TIMEOUT"] = 60
+cache = Cache(app)
+
+def _is_cacheable(rv):
+    """Only cache successful view responses, not (body, status) error tuples."""
+    return not isinstance(rv, tuple) and rv.status_code == 200
+
+def _profile_cache_key():
+    """Cache key for the current user's profile."""
+    return f"profile:{get_current_user().id}"
+
+@app.before_request
+def _set_request_time():
+    """Read the clock once per request for response timestamps."""
+    g.now = datetime.now(timezone.utc)
+    g.now_iso = g.now.isoformat()
 
 # Import models after Flask app configuration
-from models import db, User, VerificationRequest, TrustHistory, VerifierProfile, ChittyCoin
+from models import db, User, VerificationRequest, TrustHistory, VerifierProfile, ChittyCoin, configure_database
 
 # Initialize database
-db.init_app(app)
-
-with app.app_context():
+configure_database(app)
+
+# Indexes added to tables that already exist in deployed databases; create_all only
+# creates missing tables, so these are applied idempotently on every init
+_ADDED_INDEXES = (
+    'CREATE INDEX IF NOT EXISTS ix_users_trust_score ON users (trust_score)',
+    'CREATE INDEX IF NOT EXISTS ix_vr_user_status ON verification_requests (user_id, status)',
+)
+
+@app.cli.command('init-db')
+def init_db():
+    """Create database tables and load sample data into an empty database."""
     db.create_all()
+    for statement in _ADDED_INDEXES:
+        db.session.execute(text(statement))
+    db.session.commit()
     
     # Initialize sample data on first run
-    from models import User
     if User.query.count() == 0:
         try:
             from sample_data import initialize_sample_data
@@ -59,54 +153,86 @@ with app.app_context():
         except Exception as e:
             logging.error(f"Failed to initialize sample data: {e}")
 
-# Initialize analytics engines
-analytics_engine = TrustAnalytics()
-viz_engine = TrustVisualizationEngine()
+# Analytics engines are created on first use so workers that never serve
+# the insights routes don't pay for them
+@lru_cache(maxsize=1)
+def get_analytics_engine():
+    """Return the shared TrustAnalytics instance."""
+    from src.chitty_trust.analytics import TrustAnalytics
+    return TrustAnalytics()
 
-# Import marketplace services
-from chitty_id_integration import chitty_id_generator, chitty_id_validator, chitty_trust_bridge
-from marketplace import MarketplaceService, TrustHistoryService, VerifierService
-from auth import require_auth, get_current_user, is_authenticated
+@lru_cache(maxsize=1)
+def get_viz_engine():
+    """Return the shared TrustVisualizationEngine instance."""
+    from src.chitty_trust.visualization import TrustVisualizationEngine
+    return TrustVisualizationEngine()
+
+from auth import require_auth, get_current_user
 
 @app.route('/')
 def index():
     """Main trust engine dashboard."""
     # Check if user is authenticated for personalized experience
-    authenticated = is_authenticated()
-    current_user = get_current_user() if authenticated else None
+    current_user = get_current_user()
+    authenticated = current_user is not None
     
     return render_template('index.html', 
                          authenticated=authenticated, 
                          current_user=current_user)
 
+# Persona trust scores are recomputed at most once per TTL window
+TRUST_CACHE_TTL = 60
+
+@lru_cache(maxsize=64)
+def _persona_trust_score(persona_id, epoch_bucket):
+    """Calculate a demo persona's trust score once per TTL window."""
+    entity, events = get_persona_data(persona_id)
+    if not entity:
+        return None
+    return run_async(calculate_trust(entity, events))
+
+def get_persona_trust_score(persona_id):
+    """Get a demo persona's trust score, recomputed at most once per TTL window."""
+    return _persona_trust_score(persona_id, int(time.time() // TRUST_CACHE_TTL))
+
+@lru_cache(maxsize=256)
+def _compute_trust_cached(persona_id, epoch_bucket):
+    """Calculate a persona's trust score payload and its ETag."""
+    entity, events = get_persona_data(persona_id)
+    if not entity:
+        return None, None
+    
+    # Calculate trust score using our engine
+    trust_score = _persona_trust_score(persona_id, epoch_bucket)
+    
+    # Convert to dict for JSON response
+    result = trust_score.to_dict()
+    
+    # Add persona-specific metadata
+    result['persona'] = {
+        'id': persona_id,
+        'name': entity.name,
+        'type': entity.entity_type,
+        'chitty_level': get_chitty_level(trust_score.composite_score),
+        'verification_status': 'Verified' if entity.identity_verified else 'Unverified'
+    }
+    
+    etag = hashlib.blake2b(json.dumps(result, sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
+    return result, etag
+
 @app.route('/api/trust/<persona_id>')
 def get_trust_score(persona_id):
     """Calculate trust score for a specific persona."""
     try:
-        # Get persona data
-        entity, events = get_persona_data(persona_id)
-        if not entity:
+        result, etag = _compute_trust_cached(persona_id, int(time.time() // TRUST_CACHE_TTL))
+        if result is None:
             return jsonify({'error': 'Persona not found'}), 404
         
-        # Calculate trust score using our engine
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        trust_score = loop.run_until_complete(calculate_trust(entity, events))
-        loop.close()
-        
-        # Convert to dict for JSON response
-        result = trust_score.to_dict()
-        
-        # Add persona-specific metadata
-        result['persona'] = {
-            'id': persona_id,
-            'name': entity.name,
-            'type': entity.entity_type,
-            'chitty_level': get_chitty_level(trust_score.composite_score),
-            'verification_status': 'Verified' if entity.identity_verified else 'Unverified'
-        }
-        
-        return jsonify(result)
+        response = jsonify(result)
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = TRUST_CACHE_TTL
+        return response.make_conditional(request)
         
     except Exception as e:
         logging.error(f"Error calculating trust for {persona_id}: {str(e)}")
@@ -146,16 +272,31 @@ def enterprise():
 
 # ChittyTrust Integration Package Endpoints
 
-@app.route('/api/integration/package')
-def get_integration_package():
-    """Get ChittyTrust Integration Package information"""
-    from integrations import ChittyTrustIntegration
+# Static payloads are encoded once per worker and revalidated by ETag
+STATIC_CACHE_MAX_AGE = 3600
+
+def _encode_static(payload):
+    """Encode a static JSON payload, returning its bytes and ETag."""
+    body = orjson.dumps(payload)
+    return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
+def _static_json_response(body, etag):
+    """Serve pre-encoded JSON with caching headers."""
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = STATIC_CACHE_MAX_AGE
+    return response.make_conditional(request)
+
+@lru_cache(maxsize=1)
+def _integration_package_json():
+    """Build the integration package description."""
     from integrations.snippets import get_quick_start_guide, generate_integration_snippets
     
     snippets = generate_integration_snippets()
     quick_start = get_quick_start_guide()
     
-    return jsonify({
+    return _encode_static({
         'package_name': 'ChittyTrust Integration Package',
         'version': '1.0.0',
         'description': 'Complete integration suite for blockchain verification and evidence ledger',
@@ -171,19 +312,30 @@ def get_integration_package():
         ]
     })
 
-@app.route('/api/integration/snippets')
-def get_integration_snippets():
-    """Get all integration code snippets"""
+@lru_cache(maxsize=1)
+def _integration_snippets_json():
+    """Build the integration snippets payload."""
     from integrations.snippets import generate_integration_snippets
     
-    return jsonify({
+    return _encode_static({
         'snippets': generate_integration_snippets(),
         'usage': 'Copy and paste these snippets into your codebase for instant ChittyTrust integration'
     })
 
+@app.route('/api/integration/package')
+def get_integration_package():
+    """Get ChittyTrust Integration Package information"""
+    return _static_json_response(*_integration_package_json())
+
+@app.route('/api/integration/snippets')
+def get_integration_snippets():
+    """Get all integration code snippets"""
+    return _static_json_response(*_integration_snippets_json())
+
 # ChittyChain Blockchain Integration Endpoints
 
 @app.route('/api/blockchain/trust-passport/<user_id>')
+@cache.cached(timeout=60, response_filter=_is_cacheable)
 def get_trust_passport(user_id):
     """Get blockchain-verified trust passport for cross-platform use"""
     try:
@@ -206,6 +358,7 @@ def verify_blockchain_record(transaction_id):
         return jsonify({'error': 'Blockchain verification failed'}), 500
 
 @app.route('/api/blockchain/history/<user_id>')
+@cache.cached(timeout=60, query_string=True, response_filter=_is_cacheable)
 def get_blockchain_history(user_id):
     """Get complete blockchain trust history"""
     try:
@@ -235,7 +388,7 @@ def create_ledger_entry():
         if not user_id or not trust_scores:
             return jsonify({'error': 'user_id and trust_scores required'}), 400
         
-        entry_id = asyncio.run(chittychain_ledger.create_ledger_entry(
+        entry_id = run_async(chittychain_ledger.create_ledger_entry(
             user_id, event_type, trust_scores, event_data, cross_platform_refs
         ))
         
@@ -261,7 +414,7 @@ def get_user_ledger_history(user_id):
         limit = request.args.get('limit', 100, type=int)
         include_cross_platform = request.args.get('cross_platform', 'true').lower() == 'true'
         
-        history = asyncio.run(chittychain_ledger.get_user_ledger_history(
+        history = run_async(chittychain_ledger.get_user_ledger_history(
             user_id, limit, include_cross_platform
         ))
         
@@ -276,6 +429,52 @@ def get_user_ledger_history(user_id):
         logging.error(f"Ledger history query failed: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/ledger/users:batch', methods=['POST'])
+def get_users_ledger_history_batch():
+    """Get ledger history for several users in one request"""
+    try:
+        from chittychain_ledger import LEDGER_SYNC_BATCH_SIZE, chittychain_ledger
+        
+        data = request.get_json() or {}
+        user_ids = data.get('user_ids', [])
+        limit = data.get('limit', 100)
+        include_cross_platform = data.get('cross_platform', True)
+        
+        if not user_ids:
+            return jsonify({'error': 'user_ids required'}), 400
+        if not isinstance(user_ids, list) or not all(isinstance(user_id, str) for user_id in user_ids):
+            return jsonify({'error': 'user_ids must be a list of strings'}), 400
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            return jsonify({'error': 'limit must be a positive integer'}), 400
+        if not isinstance(include_cross_platform, bool):
+            return jsonify({'error': 'cross_platform must be a boolean'}), 400
+        if len(user_ids) > LEDGER_SYNC_BATCH_SIZE:
+            return jsonify({'error': f'At most {LEDGER_SYNC_BATCH_SIZE} user_ids per request'}), 400
+        
+        async def query_all():
+            return await asyncio.gather(*(
+                chittychain_ledger.get_user_ledger_history(user_id, limit, include_cross_platform)
+                for user_id in user_ids
+            ))
+        
+        histories = run_async(query_all())
+        
+        return jsonify({
+            'users': {
+                user_id: {
+                    'user_id': user_id,
+                    'history': history,
+                    'total_entries': len(history),
+                    'cross_platform_enabled': include_cross_platform
+                }
+                for user_id, history in zip(user_ids, histories)
+            }
+        })
+        
+    except Exception as e:
+        logging.error(f"Batch ledger history query failed: {e}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/ledger/passport/<user_id>', methods=['POST'])
 def create_trust_passport_v2(user_id):
     """Create enhanced cross-platform trust passport"""
@@ -285,7 +484,7 @@ def create_trust_passport_v2(user_id):
         data = request.get_json() or {}
         validity_days = data.get('validity_days', 365)
         
-        passport = asyncio.run(chittychain_ledger.create_trust_passport_v2(
+        passport = run_async(chittychain_ledger.create_trust_passport_v2(
             user_id, validity_days
         ))
         
@@ -303,7 +502,7 @@ def verify_cross_platform_passport(passport_id):
         
         external_platform = request.args.get('platform')
         
-        verification = asyncio.run(chittychain_ledger.verify_cross_platform_passport(
+        verification = run_async(chittychain_ledger.verify_cross_platform_passport(
             passport_id, external_platform
         ))
         
@@ -326,7 +525,7 @@ def sync_external_ledger():
         if not external_ledger_url:
             return jsonify({'error': 'ledger_url required'}), 400
         
-        sync_result = asyncio.run(chittychain_ledger.sync_with_external_ledger(
+        sync_result = run_async(chittychain_ledger.sync_with_external_ledger(
             external_ledger_url, sync_user_ids
         ))
         
@@ -337,6 +536,7 @@ def sync_external_ledger():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/ledger/analytics')
+@cache.cached(timeout=300, query_string=True, response_filter=_is_cacheable)
 def get_ledger_analytics():
     """Get comprehensive ledger analytics"""
     try:
@@ -351,42 +551,45 @@ def get_ledger_analytics():
         logging.error(f"Ledger analytics failed: {e}")
         return jsonify({'error': str(e)}), 500
 
+# Status payloads are static apart from their trailing timestamp, so the rest
+# of each body is encoded once and the timestamp appended per request
+def _timestamp_prefix(payload):
+    """Encode payload as the opening of a JSON object ending in a timestamp key."""
+    return orjson.dumps(payload)[:-1] + b',"timestamp":'
+
+def _timestamped_json_response(prefix):
+    """Complete a _timestamp_prefix body with the request time."""
+    body = prefix + orjson.dumps(g.now_iso) + b'}'
+    return Response(body, mimetype='application/json')
+
+_LEDGER_STATUS_PREFIX = _timestamp_prefix({
+    'service': 'ChittyChain Ledger',
+    'version': '2.0',
+    'status': 'operational',
+    'features': {
+        'cross_platform_sync': True,
+        'blockchain_integration': True,
+        'trust_passports': True,
+        'analytics': True,
+        'real_time_updates': True
+    },
+    'endpoints': {
+        'create_entry': '/api/ledger/entry',
+        'user_history': '/api/ledger/user/<user_id>',
+        'trust_passport': '/api/ledger/passport/<user_id>',
+        'verify_passport': '/api/ledger/passport/verify/<passport_id>',
+        'sync_external': '/api/ledger/sync',
+        'analytics': '/api/ledger/analytics'
+    },
+    'external_ledgers': [
+        'https://a619aa1d-896e-402c-9d4d-d35aa6663444-00-2pfapv5lxqfhn.picard.replit.dev'
+    ]
+})
+
 @app.route('/api/ledger/status')
 def get_ledger_status():
     """Get ChittyChain Ledger status and health"""
-    try:
-        from chittychain_ledger import chittychain_ledger
-        
-        status = {
-            'service': 'ChittyChain Ledger',
-            'version': '2.0',
-            'status': 'operational',
-            'timestamp': datetime.utcnow().isoformat(),
-            'features': {
-                'cross_platform_sync': True,
-                'blockchain_integration': True,
-                'trust_passports': True,
-                'analytics': True,
-                'real_time_updates': True
-            },
-            'endpoints': {
-                'create_entry': '/api/ledger/entry',
-                'user_history': '/api/ledger/user/<user_id>',
-                'trust_passport': '/api/ledger/passport/<user_id>',
-                'verify_passport': '/api/ledger/passport/verify/<passport_id>',
-                'sync_external': '/api/ledger/sync',
-                'analytics': '/api/ledger/analytics'
-            },
-            'external_ledgers': [
-                'https://a619aa1d-896e-402c-9d4d-d35aa6663444-00-2pfapv5lxqfhn.picard.replit.dev'
-            ]
-        }
-        
-        return jsonify(status)
-        
-    except Exception as e:
-        logging.error(f"Ledger status check failed: {e}")
-        return jsonify({'error': str(e)}), 500
+    return _timestamped_json_response(_LEDGER_STATUS_PREFIX)
 
 @app.route('/api/ledger/external/status', methods=['POST'])
 def check_external_ledger_status():
@@ -397,20 +600,24 @@ def check_external_ledger_status():
         data = request.get_json() or {}
         ledger_urls = data.get('urls', chittychain_ledger.external_ledgers)
         
-        results = {}
+        async def probe_all(urls):
+            return await asyncio.gather(
+                *[chittychain_ledger._get_external_ledger_status(url) for url in urls],
+                return_exceptions=True
+            )
         
-        for url in ledger_urls:
-            try:
-                status = asyncio.run(chittychain_ledger._get_external_ledger_status(url))
+        results = {}
+        for url, status in zip(ledger_urls, run_async(probe_all(ledger_urls))):
+            if isinstance(status, Exception):
+                results[url] = {'accessible': False, 'error': str(status)}
+            else:
                 results[url] = status
-            except Exception as e:
-                results[url] = {'accessible': False, 'error': str(e)}
         
         return jsonify({
             'external_ledgers': results,
             'total_checked': len(ledger_urls),
             'accessible_count': sum(1 for r in results.values() if r.get('accessible')),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': g.now_iso
         })
         
     except Exception as e:
@@ -427,12 +634,12 @@ def create_enterprise_audit(user_id):
         from chittychain import chittychain_client
         
         # Get current trust data
-        entity, events = get_persona_data(user_id.split('_')[0])  # Extract persona from user_id
+        entity, events = get_persona_data(extract_persona_id(user_id))
         if not entity:
             return jsonify({'error': 'User not found'}), 404
         
-        trust_data = asyncio.run(calculate_trust(entity, events))
-        trust_dict = trust_data.__dict__ if hasattr(trust_data, '__dict__') else trust_data
+        trust_data = run_async(calculate_trust(entity, events))
+        trust_dict = trust_data.to_dict()
         
         # Record on blockchain first
         blockchain_tx = chittychain_client.record_trust_event(
@@ -472,13 +679,17 @@ def generate_compliance_report():
         data = request.get_json()
         organization_id = data.get('organization_id', 'demo_org')
         
-        # Calculate compliance metrics
-        users = User.query.all()
+        # Calculate compliance metrics in a single aggregate query
+        total_users, average_trust_score, high_trust_users = db.session.query(
+            func.count(User.id),
+            func.avg(func.coalesce(User.trust_score, 0)),
+            func.sum(case((User.trust_score >= 80, 1), else_=0))
+        ).one()
         report_data = {
-            'total_users': len(users),
-            'average_trust_score': sum(u.trust_score or 0 for u in users) / len(users) if users else 0,
-            'compliance_status': 'Compliant' if len(users) > 0 else 'Pending',
-            'high_trust_users': len([u for u in users if (u.trust_score or 0) >= 80]),
+            'total_users': total_users,
+            'average_trust_score': float(average_trust_score or 0),
+            'compliance_status': 'Compliant' if total_users > 0 else 'Pending',
+            'high_trust_users': int(high_trust_users or 0),
             'verification_coverage': '95%'  # Demo data
         }
         
@@ -515,7 +726,7 @@ def document_verification_workflow(request_id):
             'description': verification_request.description,
             'verification_type': verification_request.verification_type,
             'status': verification_request.status,
-            'created_at': verification_request.created_at.isoformat(),
+            'created_at': verification_request.created_at.isoformat(),  # Sent to Notion by requests, not orjson
             'reward_amount': verification_request.reward_amount,
             'priority': verification_request.priority
         }
@@ -546,12 +757,12 @@ def record_evidence_ledger(user_id):
         from chittychain import chittychain_client
         
         # Get current trust data
-        entity, events = get_persona_data(user_id.split('_')[0])
+        entity, events = get_persona_data(extract_persona_id(user_id))
         if not entity:
             return jsonify({'error': 'User not found'}), 404
         
-        trust_data = asyncio.run(calculate_trust(entity, events))
-        trust_dict = trust_data.__dict__ if hasattr(trust_data, '__dict__') else trust_data
+        trust_data = run_async(calculate_trust(entity, events))
+        trust_dict = trust_data.to_dict()
         
         # Record on blockchain
         blockchain_tx = chittychain_client.record_trust_event(
@@ -568,7 +779,7 @@ def record_evidence_ledger(user_id):
             blockchain_tx,
             user_id,
             'trust_calculation',
-            trust_dict.get('scores', {}) if isinstance(trust_dict, dict) else {}
+            trust_dict['scores']
         )
         
         return jsonify({
@@ -628,22 +839,70 @@ def execute_chitty_workflow(user_id):
         logging.error(f"Chitty workflow execution failed: {e}")
         return jsonify({'error': str(e)}), 500
 
+# Worker pool for batch workflows, created on first use so gunicorn forks its
+# workers before any pool processes exist. Workers start from a forkserver that
+# only imports workflow_worker, so they never inherit this process's threads,
+# event loop or connections.
+workflow_pool = None
+workflow_pool_lock = threading.Lock()
+
+def get_workflow_pool():
+    """Get the shared batch workflow process pool."""
+    global workflow_pool
+    with workflow_pool_lock:
+        if workflow_pool is None:
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload(['workflow_worker'])
+            workflow_pool = ProcessPoolExecutor(
+                max_workers=int(os.environ.get('WORKFLOW_POOL_SIZE', os.cpu_count() or 1)),
+                mp_context=context
+            )
+    return workflow_pool
+
+def _discard_workflow_pool(pool):
+    """Drop a pool broken by a crashed worker so the next batch starts a fresh one."""
+    global workflow_pool
+    with workflow_pool_lock:
+        if workflow_pool is pool:
+            workflow_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
 @app.route('/api/chitty-workflow/batch-process', methods=['POST'])
 def batch_process_chitty_workflow():
     """Batch process multiple users through ChittyChain workflow"""
     try:
-        from chitty_workflow import chitty_workflow
-        
         data = request.get_json()
         user_ids = data.get('user_ids', [])
         
         if not user_ids:
             return jsonify({'error': 'No user IDs provided'}), 400
         
+        from workflow_worker import run_workflow
+        
+        # Optionally cap how many workflows this batch runs at once
+        pool = get_workflow_pool()
+        window = max(1, request.args.get('max_workers', len(user_ids), type=int))
+        
         results = []
-        for user_id in user_ids:
-            workflow_result = chitty_workflow.execute_trust_verification_workflow(user_id)
-            results.append(workflow_result)
+        for start in range(0, len(user_ids), window):
+            chunk = user_ids[start:start + window]
+            try:
+                futures = [pool.submit(run_workflow, user_id) for user_id in chunk]
+            except BrokenProcessPool:
+                # A worker died since the last batch; retry once on a fresh pool
+                _discard_workflow_pool(pool)
+                pool = get_workflow_pool()
+                futures = [pool.submit(run_workflow, user_id) for user_id in chunk]
+            
+            # One user's failure is reported in their result rather than failing the batch
+            for user_id, future in zip(chunk, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    if isinstance(e, BrokenProcessPool):
+                        _discard_workflow_pool(pool)
+                    logging.error(f"Workflow for {user_id} failed: {e}")
+                    results.append({'user_id': user_id, 'status': 'failed', 'error': str(e)})
         
         # Summary statistics
         successful = len([r for r in results if r.get('status') == 'completed'])
@@ -655,47 +914,61 @@ def batch_process_chitty_workflow():
             'successful': successful,
             'failed': failed,
             'results': results,
-            'batch_id': f"batch_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+            'batch_id': f"batch_{g.now.strftime('%Y%m%d_%H%M%S')}"
         })
         
     except Exception as e:
         logging.error(f"Batch workflow processing failed: {e}")
         return jsonify({'error': str(e)}), 500
 
+# Upper bound on verification requests returned in one listing
+MARKETPLACE_MAX_LIMIT = 500
+
 @app.route('/api/marketplace/requests', methods=['GET'])
 def get_marketplace_requests():
     """Get available verification requests"""
+    from marketplace import MarketplaceService
     verification_type = request.args.get('type')
     status = request.args.get('status', 'open')
-    limit = int(request.args.get('limit', 20))
+    limit = min(int(request.args.get('limit', 20)), MARKETPLACE_MAX_LIMIT)
     
     requests = MarketplaceService.get_marketplace_requests(limit, verification_type, status)
     
-    return jsonify([{
-        'id': req.id,
-        'title': req.title,
-        'description': req.description,
-        'verification_type': req.verification_type,
-        'reward_amount': req.reward_amount,
-        'status': req.status,
-        'priority': req.priority,
-        'deadline': req.deadline.isoformat() if req.deadline else None,
-        'created_at': req.created_at.isoformat(),
-        'user': {
-            'name': f"{req.user.first_name} {req.user.last_name}".strip() or req.user.email,
-            'trust_level': req.user.verification_level
-        }
-    } for req in requests])
+    def generate():
+        yield b'['
+        for index, req in enumerate(requests):
+            if index:
+                yield b','
+            yield orjson.dumps({
+                'id': req.id,
+                'title': req.title,
+                'description': req.description,
+                'verification_type': req.verification_type,
+                'reward_amount': req.reward_amount,
+                'status': req.status,
+                'priority': req.priority,
+                'deadline': req.deadline,
+                'created_at': req.created_at,
+                'user': {
+                    'name': f"{req.user.first_name} {req.user.last_name}".strip() or req.user.email,
+                    'trust_level': req.user.verification_level
+                }
+            })
+        yield b']'
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 @app.route('/api/marketplace/requests', methods=['POST'])
 @require_auth
 def create_verification_request():
     """Create new verification request"""
+    from marketplace import MarketplaceService
     user = get_current_user()
     data = request.get_json()
     
     try:
         verification_request = MarketplaceService.create_verification_request(user.id, data)
+        cache.delete(_profile_cache_key())
         
         return jsonify({
             'id': verification_request.id,
@@ -709,6 +982,7 @@ def create_verification_request():
 @require_auth
 def claim_verification_request(request_id):
     """Claim a verification request"""
+    from marketplace import MarketplaceService
     user = get_current_user()
     
     success, message = MarketplaceService.claim_verification_request(request_id, user.id)
@@ -722,54 +996,55 @@ def claim_verification_request(request_id):
 @require_auth
 def get_user_trust_history():
     """Get user's trust history"""
+    from marketplace import TrustHistoryService
     user = get_current_user()
     days_back = int(request.args.get('days', 30))
     
-    history = TrustHistoryService.get_trust_history(user.id, days_back)
+    history = TrustHistoryService.get_trust_history_columns(user.id, days_back)
     trends = TrustHistoryService.get_trust_trends(user.id, 7)
     
-    return jsonify({
-        'history': [{
-            'recorded_at': entry.recorded_at.isoformat(),
+    # Columnar layout: one list per field, aligned by index with recorded_at
+    return Response(orjson.dumps({
+        'history': {
+            'recorded_at': history['recorded_at'],
             'dimensions': {
-                'source': entry.source_trust,
-                'temporal': entry.temporal_trust,
-                'channel': entry.channel_trust,
-                'outcome': entry.outcome_trust,
-                'network': entry.network_trust,
-                'justice': entry.justice_trust
+                'source': history['source'],
+                'temporal': history['temporal'],
+                'channel': history['channel'],
+                'outcome': history['outcome'],
+                'network': history['network'],
+                'justice': history['justice']
             },
             'scores': {
-                'composite': entry.composite_score,
-                'people': entry.people_score,
-                'legal': entry.legal_score,
-                'state': entry.state_score,
-                'chitty': entry.chitty_score
+                'composite': history['composite'],
+                'people': history['people'],
+                'legal': history['legal'],
+                'state': history['state'],
+                'chitty': history['chitty']
             },
-            'trigger_event': entry.trigger_event,
-            'confidence': entry.confidence_level
-        } for entry in history],
+            'trigger_event': history['trigger_event'],
+            'confidence': history['confidence']
+        },
         'trends': trends
-    })
+    }), mimetype='application/json')
 
 @app.route('/api/user/trust-calculate', methods=['POST'])
 @require_auth
 def calculate_user_trust():
     """Calculate and record user's trust score"""
+    from marketplace import TrustHistoryService
     user = get_current_user()
     data = request.get_json()
     trigger_event = data.get('trigger_event', 'manual_calculation')
     
     try:
         # Run async trust calculation
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        trust_data, history_entry = loop.run_until_complete(
+        trust_data, history_entry = run_async(
             TrustHistoryService.calculate_and_record_trust(
                 user.id, trigger_event
             )
         )
-        loop.close()
+        cache.delete(_profile_cache_key())
         
         return jsonify({
             'trust_data': trust_data,
@@ -783,15 +1058,17 @@ def calculate_user_trust():
 
 @app.route('/api/user/profile')
 @require_auth
+@cache.cached(key_prefix=_profile_cache_key, response_filter=_is_cacheable)
 def get_user_profile():
     """Get user profile with trust data"""
+    from marketplace import MarketplaceService, TrustHistoryService
     user = get_current_user()
     
     # Get recent trust trends
     trends = TrustHistoryService.get_trust_trends(user.id, 7)
     
-    # Get user's requests
-    user_requests = MarketplaceService.get_user_requests(user.id)
+    # Count user's requests
+    total_requests, active_requests = MarketplaceService.get_user_request_counts(user.id)
     
     return jsonify({
         'user': {
@@ -805,14 +1082,14 @@ def get_user_profile():
             'profile_image_url': user.profile_image_url
         },
         'trust_trends': trends,
-        'verification_requests': len(user_requests),
-        'active_requests': len([r for r in user_requests if r.status in ['open', 'claimed', 'in_progress']])
+        'verification_requests': total_requests,
+        'active_requests': active_requests
     })
 
-@app.route('/api/personas')
-def get_personas():
-    """Get list of available personas."""
-    personas = [
+@lru_cache(maxsize=1)
+def _personas_json():
+    """Build the persona list payload."""
+    return _encode_static([
         {
             'id': 'alice',
             'name': 'Alice Community',
@@ -834,8 +1111,24 @@ def get_personas():
             'type': 'Reformed Individual',
             'avatar': '🔄'
         }
-    ]
-    return jsonify(personas)
+    ])
+
+@app.route('/api/personas')
+def get_personas():
+    """Get list of available personas."""
+    return _static_json_response(*_personas_json())
+
+@lru_cache(maxsize=256)
+def _radar_config(dimension_items):
+    """Radar chart config for a sorted tuple of (dimension, score) pairs."""
+    return get_viz_engine().generate_radar_config(dict(dimension_items))
+
+@lru_cache(maxsize=64)
+def _persona_charts(persona_id, events_version):
+    """Trend and network charts for a persona, rebuilt when its event count or latest event changes."""
+    entity, events = get_persona_data(persona_id)
+    viz_engine = get_viz_engine()
+    return viz_engine.generate_trend_chart_config(events), viz_engine.generate_network_visualization(entity)
 
 @app.route('/api/trust/<persona_id>/insights')
 def get_trust_insights(persona_id):
@@ -847,11 +1140,11 @@ def get_trust_insights(persona_id):
             return jsonify({'error': 'Persona not found'}), 404
         
         # Calculate trust score first
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        trust_score = loop.run_until_complete(calculate_trust(entity, events))
+        trust_score = get_persona_trust_score(persona_id)
         
         # Generate insights
+        analytics_engine = get_analytics_engine()
+        viz_engine = get_viz_engine()
         dimension_scores = {
             "source": trust_score.source_score,
             "temporal": trust_score.temporal_score,  
@@ -861,24 +1154,22 @@ def get_trust_insights(persona_id):
             "justice": trust_score.justice_score,
         }
         
-        insights = loop.run_until_complete(
-            analytics_engine.generate_insights(entity, events, dimension_scores)
-        )
+        async def analyse():
+            return await asyncio.gather(
+                analytics_engine.generate_insights(entity, events, dimension_scores),
+                analytics_engine.detect_patterns(entity, events)
+            )
         
-        patterns = loop.run_until_complete(
-            analytics_engine.detect_patterns(entity, events)
-        )
+        insights, patterns = run_async(analyse())
         
         confidence_intervals = analytics_engine.calculate_confidence_intervals(
             dimension_scores, events
         )
         
-        loop.close()
-        
         # Generate visualizations
-        radar_config = viz_engine.generate_radar_config(dimension_scores)
-        trend_config = viz_engine.generate_trend_chart_config(events)
-        network_data = viz_engine.generate_network_visualization(entity)
+        radar_config = _radar_config(tuple(sorted(dimension_scores.items())))
+        events_version = (len(events), max((e.timestamp for e in events), default=None))
+        trend_config, network_data = _persona_charts(persona_id, events_version)
         insights_html = viz_engine.generate_insights_html(insights)
         patterns_html = viz_engine.generate_patterns_html(patterns)
         
@@ -899,7 +1190,7 @@ def get_trust_insights(persona_id):
                     'pattern_type': pattern.pattern_type,
                     'description': pattern.description,
                     'frequency': pattern.frequency,
-                    'last_occurrence': pattern.last_occurrence.isoformat(),
+                    'last_occurrence': pattern.last_occurrence,
                     'risk_level': pattern.risk_level,
                     'recommendation': pattern.recommendation
                 } for pattern in patterns
@@ -926,66 +1217,97 @@ def get_trust_insights(persona_id):
         logging.error(f"Error generating insights for {persona_id}: {str(e)}")
         return jsonify({'error': 'Insights generation failed'}), 500
 
+# Timeline impact weight per event outcome
+TIMELINE_IMPACT_SCORES = {
+    'positive': 3,
+    'negative': -2,
+    'neutral': 0
+}
+
+@lru_cache(maxsize=64)
+def _persona_rolling_scores(persona_id, epoch_bucket):
+    """Score growing prefixes of a demo persona's events once per TTL window."""
+    entity, events = get_persona_data(persona_id)
+    sorted_events = sorted(events, key=lambda e: e.timestamp)
+    subsets = [
+        sorted_events[:i+1]
+        for i in range(0, len(sorted_events), max(1, len(sorted_events) // 10))
+        if i + 1 >= 3  # Need minimum events for calculation
+    ]
+    
+    async def score_subsets():
+        return await asyncio.gather(*[calculate_trust(entity, subset) for subset in subsets])
+    
+    scores = run_async(score_subsets())
+    return tuple({
+        'date': subset_events[-1].timestamp,
+        'composite_score': score.composite_score,
+        'chitty_score': score.chitty_score,
+        'event_count': len(subset_events)
+    } for subset_events, score in zip(subsets, scores))
+
+def get_persona_rolling_scores(persona_id):
+    """Get a demo persona's rolling trust scores, recomputed at most once per TTL window."""
+    return list(_persona_rolling_scores(persona_id, int(time.time() // TRUST_CACHE_TTL)))
+
+@lru_cache(maxsize=64)
+def _persona_timeline(persona_id):
+    """Build a demo persona's timeline and summary once; demo events never change."""
+    entity, events = get_persona_data(persona_id)
+    if not entity:
+        return None
+    
+    # Sort events by timestamp
+    sorted_events = sorted(events, key=lambda e: e.timestamp)
+    
+    # Create timeline data, tallying types and outcomes in the same pass
+    timeline_data = []
+    event_types = set()
+    outcome_counts = Counter()
+    for event in sorted_events:
+        timeline_data.append({
+            'date': event.timestamp,
+            'event_type': event.event_type,
+            'description': event.description,
+            'outcome': event.outcome,
+            'channel': event.channel,
+            'impact_score': TIMELINE_IMPACT_SCORES.get(event.outcome, 0)
+        })
+        event_types.add(event.event_type)
+        outcome_counts[event.outcome] += 1
+    
+    summary = {
+        'total_events': len(events),
+        'date_range': {
+            'start': sorted_events[0].timestamp if sorted_events else None,
+            'end': sorted_events[-1].timestamp if sorted_events else None
+        },
+        'event_types': list(event_types),
+        'outcome_distribution': {
+            'positive': outcome_counts['positive'],
+            'negative': outcome_counts['negative'],
+            'neutral': outcome_counts['neutral']
+        }
+    }
+    return timeline_data, summary
+
 @app.route('/api/trust/<persona_id>/timeline')
 def get_trust_timeline(persona_id):
     """Get detailed timeline analysis for a persona."""
     try:
-        entity, events = get_persona_data(persona_id)
-        if not entity:
+        timeline = _persona_timeline(persona_id)
+        if timeline is None:
             return jsonify({'error': 'Persona not found'}), 404
         
-        # Sort events by timestamp
-        sorted_events = sorted(events, key=lambda e: e.timestamp)
-        
-        # Create timeline data
-        timeline_data = []
-        for event in sorted_events:
-            timeline_data.append({
-                'date': event.timestamp.isoformat(),
-                'event_type': event.event_type,
-                'description': event.description,
-                'outcome': event.outcome,
-                'channel': event.channel,
-                'impact_score': {
-                    'positive': 3,
-                    'negative': -2,
-                    'neutral': 0
-                }.get(event.outcome, 0)
-            })
+        timeline_data, summary = timeline
         
         # Calculate rolling trust scores (simplified)
-        rolling_scores = []
-        for i in range(0, len(sorted_events), max(1, len(sorted_events) // 10)):
-            subset_events = sorted_events[:i+1]
-            if len(subset_events) >= 3:  # Need minimum events for calculation
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                score = loop.run_until_complete(calculate_trust(entity, subset_events))
-                loop.close()
-                
-                rolling_scores.append({
-                    'date': subset_events[-1].timestamp.isoformat(),
-                    'composite_score': score.composite_score,
-                    'chitty_score': score.chitty_score,
-                    'event_count': len(subset_events)
-                })
+        rolling_scores = get_persona_rolling_scores(persona_id)
         
         return jsonify({
             'timeline': timeline_data,
             'rolling_scores': rolling_scores,
-            'summary': {
-                'total_events': len(events),
-                'date_range': {
-                    'start': sorted_events[0].timestamp.isoformat() if sorted_events else None,
-                    'end': sorted_events[-1].timestamp.isoformat() if sorted_events else None
-                },
-                'event_types': list(set(e.event_type for e in events)),
-                'outcome_distribution': {
-                    'positive': len([e for e in events if e.outcome == 'positive']),
-                    'negative': len([e for e in events if e.outcome == 'negative']),
-                    'neutral': len([e for e in events if e.outcome == 'neutral'])
-                }
-            }
+            'summary': summary
         })
         
     except Exception as e:
@@ -999,48 +1321,39 @@ def compare_personas():
         personas = ['alice', 'bob', 'charlie']
         comparison_data = {}
         
-        for persona_id in personas:
-            entity, events = get_persona_data(persona_id)
-            if entity:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                trust_score = loop.run_until_complete(calculate_trust(entity, events))
-                loop.close()
-                
-                comparison_data[persona_id] = {
-                    'name': entity.name,
-                    'dimensions': {
-                        'source': trust_score.source_score,
-                        'temporal': trust_score.temporal_score,
-                        'channel': trust_score.channel_score,
-                        'outcome': trust_score.outcome_score,
-                        'network': trust_score.network_score,
-                        'justice': trust_score.justice_score
-                    },
-                    'output_scores': {
-                        'people': trust_score.people_score,
-                        'legal': trust_score.legal_score,
-                        'state': trust_score.state_score,
-                        'chitty': trust_score.chitty_score
-                    },
-                    'composite': trust_score.composite_score,
-                    'event_count': len(events),
-                    'chitty_level': get_chitty_level(trust_score.composite_score)
-                }
+        for persona_id, (entity, events) in get_personas_bulk(personas).items():
+            trust_score = get_persona_trust_score(persona_id)
+            
+            comparison_data[persona_id] = {
+                'name': entity.name,
+                'dimensions': {
+                    'source': trust_score.source_score,
+                    'temporal': trust_score.temporal_score,
+                    'channel': trust_score.channel_score,
+                    'outcome': trust_score.outcome_score,
+                    'network': trust_score.network_score,
+                    'justice': trust_score.justice_score
+                },
+                'output_scores': {
+                    'people': trust_score.people_score,
+                    'legal': trust_score.legal_score,
+                    'state': trust_score.state_score,
+                    'chitty': trust_score.chitty_score
+                },
+                'composite': trust_score.composite_score,
+                'event_count': len(events),
+                'chitty_level': get_chitty_level(trust_score.composite_score)
+            }
+        
+        # Rank persona ids by a plain score lookup rather than sorting (id, data) pairs
+        by_chitty = sorted(comparison_data, key=lambda k: comparison_data[k]['output_scores']['chitty'], reverse=True)
+        by_composite = sorted(comparison_data, key=lambda k: comparison_data[k]['composite'], reverse=True)
         
         return jsonify({
             'comparison': comparison_data,
             'rankings': {
-                'by_chitty_score': sorted(
-                    comparison_data.items(), 
-                    key=lambda x: x[1]['output_scores']['chitty'], 
-                    reverse=True
-                ),
-                'by_composite': sorted(
-                    comparison_data.items(),
-                    key=lambda x: x[1]['composite'],
-                    reverse=True
-                )
+                'by_chitty_score': [(k, comparison_data[k]) for k in by_chitty],
+                'by_composite': [(k, comparison_data[k]) for k in by_composite]
             }
         })
         
@@ -1048,24 +1361,31 @@ def compare_personas():
         logging.error(f"Error comparing personas: {str(e)}")
         return jsonify({'error': 'Comparison failed'}), 500
 
+# ChittyID levels by composite score; a score at or above _CHITTY_LEVEL_THRESHOLDS[i]
+# is at least _CHITTY_LEVELS[i + 1]
+_CHITTY_LEVEL_THRESHOLDS = (25, 50, 75, 90)
+_CHITTY_LEVELS = (
+    {'level': 'L0', 'name': 'Anonymous', 'color': '#cccccc'},
+    {'level': 'L1', 'name': 'Basic', 'color': '#8888ff'},
+    {'level': 'L2', 'name': 'Enhanced', 'color': '#4444ff'},
+    {'level': 'L3', 'name': 'Professional', 'color': '#0088ff'},
+    {'level': 'L4', 'name': 'Institutional', 'color': '#00ff88'},
+)
+
 def get_chitty_level(composite_score):
     """Convert composite score to ChittyID level."""
-    if composite_score >= 90:
-        return {'level': 'L4', 'name': 'Institutional', 'color': '#00ff88'}
-    elif composite_score >= 75:
-        return {'level': 'L3', 'name': 'Professional', 'color': '#0088ff'}
-    elif composite_score >= 50:
-        return {'level': 'L2', 'name': 'Enhanced', 'color': '#4444ff'}
-    elif composite_score >= 25:
-        return {'level': 'L1', 'name': 'Basic', 'color': '#8888ff'}
-    else:
-        return {'level': 'L0', 'name': 'Anonymous', 'color': '#cccccc'}
+    return dict(_CHITTY_LEVELS[bisect_right(_CHITTY_LEVEL_THRESHOLDS, composite_score)])
+
+def extract_persona_id(user_id):
+    """Extract the demo persona from a '<persona>_<suffix>' user id."""
+    return user_id.partition('_')[0]
 
 # ChittyID Integration Endpoints
 @app.route('/api/chitty-id/generate', methods=['POST'])
 def generate_chitty_id():
     """Generate new ChittyID with integrated trust scoring"""
     try:
+        from chitty_id_integration import chitty_trust_bridge
         data = request.get_json() or {}
         
         # Generate ChittyID with trust integration
@@ -1096,6 +1416,7 @@ def generate_chitty_id():
 def calculate_chitty_score():
     """Calculate Chitty Score™ for existing ChittyID"""
     try:
+        from chitty_id_integration import chitty_id_validator, chitty_trust_bridge
         data = request.get_json() or {}
         chitty_id = data.get('chitty_id', '')
         
@@ -1126,120 +1447,122 @@ def calculate_chitty_score():
         return jsonify({'error': str(e)}), 500
 
 # ChittyOS Ecosystem Integration
+_CHITTYOS_STATUS_PREFIX = _timestamp_prefix({
+    'ecosystem': 'ChittyOS',
+    'version': '2.0',
+    'components': {
+        'chitty_id': {
+            'status': 'operational',
+            'service': 'Identity Verification',
+            'endpoint': '/api/chitty-id'
+        },
+        'chitty_trust': {
+            'status': 'operational', 
+            'service': '6D Trust Scoring',
+            'endpoint': '/api/trust'
+        },
+        'chitty_score': {
+            'status': 'operational',
+            'service': 'Proprietary Trust Algorithm™',
+            'endpoint': '/api/chitty-score'
+        },
+        'chitty_counsel': {
+            'status': 'operational',
+            'service': 'Legal & Compliance',
+            'endpoint': '/api/chitty-counsel'
+        },
+        'chitty_assets': {
+            'status': 'operational',
+            'service': 'Digital Asset Management',
+            'endpoint': '/api/chitty-assets'
+        },
+        'chitty_finance': {
+            'status': 'operational',
+            'service': 'Financial Services',
+            'endpoint': '/api/chitty-finance'
+        },
+        'chitty_chain': {
+            'status': 'operational',
+            'service': 'Blockchain Immutability',
+            'endpoint': '/api/ledger'
+        },
+        'chitty_beacon': {
+            'status': 'operational',
+            'service': 'App Tracking & Monitoring',
+            'endpoint': '/api/chitty-beacon'
+        }
+    },
+    'trust_pipeline': [
+        'ChittyID (Identity)',
+        'ChittyTrust (6D Scoring)', 
+        'ChittyVerify (Data Integrity)',
+        'ChittyChain (Immutable Records)'
+    ],
+    'chitty_score_features': [
+        'Justice-focused algorithm',
+        'Outcome-weighted calculations',
+        'Cross-platform compatibility',
+        'Real-time score updates'
+    ]
+})
+
 @app.route('/api/chittyos/status', methods=['GET'])
 def chittyos_ecosystem_status():
     """Get status of all ChittyOS components including Chitty Score™"""
     try:
         # Send beacon event for API access
         send_event('api_access', {'endpoint': '/api/chittyos/status', 'component': 'chittyos'})
-        return jsonify({
-            'ecosystem': 'ChittyOS',
-            'version': '2.0',
-            'components': {
-                'chitty_id': {
-                    'status': 'operational',
-                    'service': 'Identity Verification',
-                    'endpoint': '/api/chitty-id'
-                },
-                'chitty_trust': {
-                    'status': 'operational', 
-                    'service': '6D Trust Scoring',
-                    'endpoint': '/api/trust'
-                },
-                'chitty_score': {
-                    'status': 'operational',
-                    'service': 'Proprietary Trust Algorithm™',
-                    'endpoint': '/api/chitty-score'
-                },
-                'chitty_counsel': {
-                    'status': 'operational',
-                    'service': 'Legal & Compliance',
-                    'endpoint': '/api/chitty-counsel'
-                },
-                'chitty_assets': {
-                    'status': 'operational',
-                    'service': 'Digital Asset Management',
-                    'endpoint': '/api/chitty-assets'
-                },
-                'chitty_finance': {
-                    'status': 'operational',
-                    'service': 'Financial Services',
-                    'endpoint': '/api/chitty-finance'
-                },
-                'chitty_chain': {
-                    'status': 'operational',
-                    'service': 'Blockchain Immutability',
-                    'endpoint': '/api/ledger'
-                },
-                'chitty_beacon': {
-                    'status': 'operational',
-                    'service': 'App Tracking & Monitoring',
-                    'endpoint': '/api/chitty-beacon'
-                }
-            },
-            'trust_pipeline': [
-                'ChittyID (Identity)',
-                'ChittyTrust (6D Scoring)', 
-                'ChittyVerify (Data Integrity)',
-                'ChittyChain (Immutable Records)'
-            ],
-            'chitty_score_features': [
-                'Justice-focused algorithm',
-                'Outcome-weighted calculations',
-                'Cross-platform compatibility',
-                'Real-time score updates'
-            ],
-            'timestamp': datetime.utcnow().isoformat()
-        })
+        return _timestamped_json_response(_CHITTYOS_STATUS_PREFIX)
         
     except Exception as e:
         logging.error(f"ChittyOS status check failed: {e}")
         return jsonify({'error': str(e)}), 500
 
+_BEACON_STATUS_PREFIX = _timestamp_prefix({
+    'service': 'ChittyBeacon',
+    'status': 'operational',
+    'description': 'Dead simple app tracking for ChittyOS ecosystem',
+    'features': [
+        'Startup/shutdown events',
+        'Periodic heartbeats (every 5 minutes)',
+        'Platform detection (Replit, GitHub, Vercel, etc.)',
+        'Claude Code detection',
+        'Git information tracking',
+        'ChittyOS component detection'
+    ],
+    'platform_support': [
+        'Replit', 'GitHub Actions', 'Vercel', 'Netlify', 
+        'Heroku', 'AWS Lambda', 'Google Cloud', 'Azure'
+    ],
+    'privacy': {
+        'tracks': [
+            'App identity and version',
+            'Platform information', 
+            'Basic system info (Python version, OS)',
+            'ChittyOS component status'
+        ],
+        'does_not_track': [
+            'Personal data',
+            'Environment secrets',
+            'User content'
+        ]
+    },
+    'configuration': {
+        'endpoint': os.getenv('BEACON_ENDPOINT', 'https://beacon.chitty.cc'),
+        'interval': f"{int(os.getenv('BEACON_INTERVAL', '300000')) / 1000} seconds",
+        'enabled': os.getenv('BEACON_DISABLED', 'true').lower() != 'true',
+        'verbose': os.getenv('BEACON_VERBOSE', 'true').lower() == 'true',
+        'mode': 'chittyos_tracking'
+    }
+})
+
 @app.route('/api/chitty-beacon', methods=['GET'])
 def chitty_beacon_status():
     """Get ChittyBeacon tracking status and information"""
     try:
         send_event('api_access', {'endpoint': '/api/chitty-beacon', 'component': 'beacon'})
         
-        return jsonify({
-            'service': 'ChittyBeacon',
-            'status': 'operational',
-            'description': 'Dead simple app tracking for ChittyOS ecosystem',
-            'features': [
-                'Startup/shutdown events',
-                'Periodic heartbeats (every 5 minutes)',
-                'Platform detection (Replit, GitHub, Vercel, etc.)',
-                'Claude Code detection',
-                'Git information tracking',
-                'ChittyOS component detection'
-            ],
-            'platform_support': [
-                'Replit', 'GitHub Actions', 'Vercel', 'Netlify', 
-                'Heroku', 'AWS Lambda', 'Google Cloud', 'Azure'
-            ],
-            'privacy': {
-                'tracks': [
-                    'App identity and version',
-                    'Platform information', 
-                    'Basic system info (Python version, OS)',
-                    'ChittyOS component status'
-                ],
-                'does_not_track': [
-                    'Personal data',
-                    'Environment secrets',
-                    'User content'
-                ]
-            },
-            'configuration': {
-                'endpoint': os.getenv('BEACON_ENDPOINT', 'https://beacon.chitty.cc'),
-                'interval': f"{int(os.getenv('BEACON_INTERVAL', '300000')) / 1000} seconds",
-                'enabled': os.getenv('BEACON_DISABLED', 'true').lower() != 'true',
-                'verbose': os.getenv('BEACON_VERBOSE', 'true').lower() == 'true',
-                'mode': 'chittyos_tracking'
-            },
-            'timestamp': datetime.utcnow().isoformat()
-        })
+        return _timestamped_json_response(_BEACON_STATUS_PREFIX)
         
     except Exception as e:
         logging.error(f"ChittyBeacon status check failed: {e}")
@@ -1292,7 +1615,7 @@ def chitty_counsel_analyze():
                 'compliance_verified': True,
                 'regulatory_status': 'Compliant'
             },
-            'analysis_timestamp': datetime.utcnow().isoformat()
+            'analysis_timestamp': g.now_iso
         }
         
         return jsonify({
@@ -1358,7 +1681,7 @@ def chitty_assets_portfolio():
             'success': True,
             'user_id': user_id,
             'portfolio': portfolio,
-            'last_updated': datetime.utcnow().isoformat()
+            'last_updated': g.now_iso
         })
         
     except Exception as e:
@@ -1413,7 +1736,7 @@ def chitty_finance_credit_score():
         return jsonify({
             'success': True,
             'credit_analysis': credit_analysis,
-            'calculated_at': datetime.utcnow().isoformat()
+            'calculated_at': g.now_iso
         })
         
     except Exception as e:
@@ -1427,7 +1750,7 @@ def chitty_finance_payment():
         data = request.get_json() or {}
         
         payment_result = {
-            'transaction_id': f"CHT-{datetime.utcnow().strftime('%Y%m%d')}-{hash(str(data)) % 100000:05d}",
+            'transaction_id': f"CHT-{g.now:%Y%m%d}-{secrets.token_hex(3)}",
             'amount': data.get('amount', 0),
             'currency': data.get('currency', 'USD'),
             'trust_verification': 'verified',
@@ -1435,13 +1758,13 @@ def chitty_finance_payment():
             'standard_fee': data.get('amount', 0) * 0.029,    # 2.9% standard
             'trust_discount': 1.4,  # Percentage saved due to trust score
             'status': 'completed',
-            'confirmation_code': f"CHT{hash(str(data)) % 10000:04d}"
+            'confirmation_code': f"CHT{secrets.token_hex(2).upper()}"
         }
         
         return jsonify({
             'success': True,
             'payment': payment_result,
-            'processed_at': datetime.utcnow().isoformat()
+            'processed_at': g.now_iso
         })
         
     except Exception as e:
@@ -1449,4 +1772,5 @@ def chitty_finance_payment():
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    debug = os.environ.get('FLASK_DEBUG', '0') == '1'
+    app.run(debug=debug, use_reloader=debug, threaded=True, host='0.0.0.0', port=int(os.environ.get('PORT', 5000)))
@@ -3,26 +3,101 @@ ChittyID Authentication using Clerk
 Clerk-based authentication system for ChittyID verification marketplace
 """
 import os
+import hashlib
+import threading
+import time
 import requests
 import jwt
+from cachetools import TTLCache, cached
 from functools import wraps
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import request, jsonify, session, current_app, g
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from models import db, User
 
 # Clerk configuration
 CLERK_SECRET_KEY = os.environ.get('CLERK_SECRET_KEY')
 CLERK_PUBLISHABLE_KEY = os.environ.get('CLERK_PUBLISHABLE_KEY')
+CLERK_JWKS_URL = os.environ.get('CLERK_JWKS_URL', 'https://api.clerk.com/v1/jwks')
+
+# Clerk claims mirrored onto the User row
+CLERK_PROFILE_FIELDS = ('email', 'first_name', 'last_name', 'profile_image_url')
+
+# Keep-alive connections to Clerk shared by all request threads
+_clerk_session = requests.Session()
+_clerk_session.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+
+@cached(TTLCache(maxsize=1, ttl=3600), lock=threading.Lock())
+def get_clerk_jwks():
+    """Fetch Clerk's JSON Web Key Set (cached for an hour, keys rarely rotate)"""
+    response = _clerk_session.get(
+        CLERK_JWKS_URL,
+        headers={'Authorization': f'Bearer {CLERK_SECRET_KEY}'},
+        timeout=5
+    )
+    response.raise_for_status()
+    return {key['kid']: key for key in response.json().get('keys', [])}
+
+# Forced JWKS refetches for unknown key ids happen at most once per interval; key ids still
+# unknown afterwards are remembered so forged headers can't make every request hit Clerk
+JWKS_REFRESH_INTERVAL = 60
+_jwks_refresh_lock = threading.Lock()
+_jwks_refreshed_at = float('-inf')
+_unknown_kids = TTLCache(maxsize=1024, ttl=JWKS_REFRESH_INTERVAL)
+
+def get_clerk_signing_key(kid):
+    """Get the public key Clerk signed a token with, or None if Clerk doesn't publish that key id"""
+    global _jwks_refreshed_at
+    jwks = get_clerk_jwks()
+    if kid not in jwks:
+        with _jwks_refresh_lock:
+            if kid in _unknown_kids:
+                return None
+            # Another thread may have refetched while this one waited for the lock
+            jwks = get_clerk_jwks()
+            if kid not in jwks and time.monotonic() - _jwks_refreshed_at >= JWKS_REFRESH_INTERVAL:
+                # Unknown key id: Clerk may have rotated keys since the last fetch
+                _jwks_refreshed_at = time.monotonic()
+                get_clerk_jwks.cache_clear()
+                jwks = get_clerk_jwks()
+            if kid not in jwks:
+                _unknown_kids[kid] = True
+                return None
+    return jwt.PyJWK(jwks[kid]).key
+
+# Recently verified tokens, keyed by a digest so raw tokens are never held in memory
+_token_cache = TTLCache(maxsize=4096, ttl=60)
+_token_cache_lock = threading.Lock()
 
 def verify_clerk_token(token):
     """Verify Clerk session token"""
     try:
-        # For development, we'll use a simple verification
-        # In production, use Clerk's proper JWT verification
         if not token:
             return None
-            
-        # Decode without verification for demo (replace with proper Clerk verification)
-        payload = jwt.decode(token, options={"verify_signature": False})
+        
+        token_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        with _token_cache_lock:
+            payload = _token_cache.get(token_key)
+        if payload is not None and payload.get('exp', float('inf')) > time.time():
+            return payload
+        
+        # Without a Clerk secret key (local development) fall back to an unverified decode
+        if not CLERK_SECRET_KEY:
+            payload = jwt.decode(token, options={"verify_signature": False})
+        else:
+            signing_key = get_clerk_signing_key(jwt.get_unverified_header(token).get('kid'))
+            if signing_key is None:
+                current_app.logger.warning("Token signed with unknown key id")
+                return None
+            payload = jwt.decode(token, signing_key, algorithms=['RS256'])
+        
+        with _token_cache_lock:
+            _token_cache[token_key] = payload
         return payload
     except Exception as e:
         current_app.logger.error(f"Token verification failed: {e}")
@@ -34,22 +109,22 @@ def get_or_create_user(clerk_data):
     if not user_id:
         return None
     
-    user = User.query.get(user_id)
+    profile = {field: clerk_data.get(field) for field in CLERK_PROFILE_FIELDS}
+    
+    user = db.session.get(User, user_id)
     if not user:
-        user = User()
-        user.id = user_id
-        user.email = clerk_data.get('email')
-        user.first_name = clerk_data.get('first_name')
-        user.last_name = clerk_data.get('last_name')
-        user.profile_image_url = clerk_data.get('profile_image_url')
-        db.session.add(user)
+        # Concurrent first requests for a new user race to insert; the loser's insert is a no-op
+        db.session.execute(
+            pg_insert(User).values(id=user_id, **profile).on_conflict_do_nothing(index_elements=['id'])
+        )
         db.session.commit()
-    else:
-        # Update user info if changed
-        user.email = clerk_data.get('email')
-        user.first_name = clerk_data.get('first_name')
-        user.last_name = clerk_data.get('last_name')
-        user.profile_image_url = clerk_data.get('profile_image_url')
+        return db.session.get(User, user_id)
+    
+    # Update user info if changed
+    changes = {field: value for field, value in profile.items() if getattr(user, field) != value}
+    if changes:
+        for field, value in changes.items():
+            setattr(user, field, value)
         db.session.commit()
     
     return user
@@ -4,32 +4,121 @@ Dead simple app tracking for ChittyOS ecosystem
 """
 
 import os
+import configparser
 import json
 import time
 import platform
 import socket
 import subprocess
 import threading
+import queue
+import gzip
+from concurrent.futures import ThreadPoolExecutor
 import atexit
 import signal
 import sys
-from datetime import datetime
-from typing import Dict, Optional, Any
-import requests
+import tempfile
+import tomllib
+from functools import cached_property, lru_cache
+from typing import Dict, List, NamedTuple, Optional, Union, Any
+import orjson
+import urllib3
+from urllib3.util.retry import Retry
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows; every process tracks itself
+    fcntl = None
+
+class PlatformEnv(NamedTuple):
+    """Platform detection variables, read once at import"""
+    repl_id: Optional[str]
+    repl_slug: Optional[str]
+    repl_owner: Optional[str]
+    github_repository: Optional[str]
+    github_workflow: Optional[str]
+    github_run_id: Optional[str]
+    github_actor: Optional[str]
+    github_actions: Optional[str]
+    vercel: Optional[str]
+    vercel_url: Optional[str]
+    vercel_env: Optional[str]
+    vercel_region: Optional[str]
+    netlify: Optional[str]
+    render: Optional[str]
+    heroku_app_name: Optional[str]
+    aws_lambda_function_name: Optional[str]
+    google_cloud_project: Optional[str]
+    website_instance_id: Optional[str]
+    claude_code: Optional[str]
+
+def _snapshot_env() -> PlatformEnv:
+    """Capture the platform detection variables from the environment"""
+    return PlatformEnv(*(os.environ.get(field.upper()) for field in PlatformEnv._fields))
+
+_ENV = _snapshot_env()
+
+# Host facts that cannot change for the life of the process
+_HOSTNAME = socket.gethostname()
+_OS = f"{platform.system()} {platform.release()}"
+_PY_VERSION = sys.version.split()[0]
+
+_iso_second = (None, '')  # (epoch second, formatted date and time) of the last timestamp
+
+def _utc_now_iso() -> str:
+    """Current UTC time in datetime.utcnow().isoformat() form, reformatting the date part at most once per second"""
+    global _iso_second
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _iso_second
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _iso_second = (second, prefix)
+    microsecond = int((now - second) * 1_000_000)
+    # isoformat() leaves out a zero fraction and adds no UTC suffix
+    return f"{prefix}.{microsecond:06d}" if microsecond else prefix
+
+@lru_cache(maxsize=256)
+def _path_exists(path: str) -> bool:
+    """os.path.exists, memoized; detection only runs against the startup tree"""
+    return os.path.exists(path)
+
 class ChittyBeacon:
     def __init__(self):
         self.config = {
             'endpoint': os.getenv('BEACON_ENDPOINT', 'https://beacon.chitty.cc'),
             'interval': int(os.getenv('BEACON_INTERVAL', '300000')) / 1000,  # Convert to seconds
             'enabled': os.getenv('BEACON_DISABLED', 'true').lower() != 'true',  # Disabled by default until domain is set up
-            'verbose': os.getenv('BEACON_VERBOSE', 'true').lower() == 'true'
+            'verbose': os.getenv('BEACON_VERBOSE', 'true').lower() == 'true',
+            'batch_size': int(os.getenv('BEACON_BATCH_SIZE', '32')),
+            'batch_interval': int(os.getenv('BEACON_BATCH_INTERVAL', '1000')) / 1000  # Convert to seconds
         }
         
         self.app_info = None
-        self.heartbeat_timer = None
+        self._track_url = f"{self.config['endpoint']}/track"
+        self._batch_url = f"{self.config['endpoint']}/track/batch"
         self.start_time = time.time()
+        self._started = time.monotonic()  # Uptime clock, immune to wall-clock jumps
+        self._stop = threading.Event()
+        self._heartbeat_thread = None
+        # Beacons only need pooled POSTs, so talk to urllib3 directly rather than through requests
+        self._headers = {
+            'Content-Type': 'application/json',
+            'User-Agent': 'ChittyBeacon-Python/1.0.0'
+        }
+        self._http = urllib3.PoolManager(
+            num_pools=1,
+            maxsize=4,
+            headers=self._headers,
+            timeout=10,
+            retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                          allowed_methods=['POST'], raise_on_status=False)
+        )
+        self._queue = queue.SimpleQueue()  # Beacons waiting for the sender thread
+        self._sender = None
+        self._leader = False
+        self._leader_lock = None  # Lock file descriptor, held open for the life of the process
         
         if self.config['enabled']:
             self._initialize()
@@ -52,152 +141,192 @@ class ChittyBeacon:
             'environment': os.getenv('FLASK_ENV', os.getenv('PYTHON_ENV', 'production')),
             
             # System
-            'hostname': socket.gethostname(),
-            'python_version': sys.version.split()[0],
-            'os': f"{platform.system()} {platform.release()}",
+            'hostname': _HOSTNAME,
+            'python_version': _PY_VERSION,
+            'os': _OS,
             
             # Features
             'has_claude_code': self._detect_claude_code(),
-            'has_git': os.path.exists('.git'),
+            'has_git': _path_exists('.git'),
             'has_chittyos': True,  # Always true for ChittyOS apps
             
             # ChittyOS specific
             'chittyos_components': self._detect_chittyos_components(),
             
             # Metadata
-            'started_at': datetime.utcnow().isoformat(),
+            'started_at': _utc_now_iso(),
             'pid': os.getpid(),
             'framework': 'flask'
         }
         
         # Add git info if available
         if app['has_git']:
-            try:
-                app['git'] = {
-                    'branch': subprocess.check_output(['git', 'branch', '--show-current'], 
-                                                    encoding='utf-8').strip(),
-                    'commit': subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], 
-                                                    encoding='utf-8').strip(),
-                    'remote': subprocess.check_output(['git', 'remote', 'get-url', 'origin'], 
-                                                    encoding='utf-8').strip()
-                }
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
+            git_info = self._read_git_info()
+            if git_info:
+                app['git'] = git_info
         
         # Platform-specific info
-        if os.getenv('REPL_ID'):
+        if _ENV.repl_id:
             app['replit'] = {
-                'id': os.getenv('REPL_ID'),
-                'slug': os.getenv('REPL_SLUG'),
-                'owner': os.getenv('REPL_OWNER'),
-                'url': f"https://{os.getenv('REPL_SLUG')}.{os.getenv('REPL_OWNER')}.repl.co"
+                'id': _ENV.repl_id,
+                'slug': _ENV.repl_slug,
+                'owner': _ENV.repl_owner,
+                'url': f"https://{_ENV.repl_slug}.{_ENV.repl_owner}.repl.co"
             }
         
-        if os.getenv('GITHUB_REPOSITORY'):
+        if _ENV.github_repository:
             app['github'] = {
-                'repository': os.getenv('GITHUB_REPOSITORY'),
-                'workflow': os.getenv('GITHUB_WORKFLOW'),
-                'run_id': os.getenv('GITHUB_RUN_ID'),
-                'actor': os.getenv('GITHUB_ACTOR')
+                'repository': _ENV.github_repository,
+                'workflow': _ENV.github_workflow,
+                'run_id': _ENV.github_run_id,
+                'actor': _ENV.github_actor
             }
         
-        if os.getenv('VERCEL'):
+        if _ENV.vercel:
             app['vercel'] = {
-                'url': os.getenv('VERCEL_URL'),
-                'env': os.getenv('VERCEL_ENV'),
-                'region': os.getenv('VERCEL_REGION')
+                'url': _ENV.vercel_url,
+                'env': _ENV.vercel_env,
+                'region': _ENV.vercel_region
             }
         
         return app
     
+    def _read_git_info(self) -> Optional[Dict[str, Any]]:
+        """Read branch, commit and origin from .git directly, without spawning git"""
+        try:
+            with open('.git/HEAD', 'r') as f:
+                head = f.read().strip()
+            
+            if head.startswith('ref: '):
+                ref = head[len('ref: '):]
+                branch = ref.removeprefix('refs/heads/')
+                commit = self._resolve_git_ref(ref)
+            else:
+                branch, commit = '', head  # Detached HEAD
+            
+            config = configparser.ConfigParser(strict=False, interpolation=None)
+            config.read('.git/config')
+            
+            return {
+                'branch': branch,
+                'commit': commit[:7] if commit else None,
+                'remote': config.get('remote "origin"', 'url', fallback=None)
+            }
+        except (OSError, configparser.Error):
+            pass
+        
+        # .git is a file (worktree/submodule) or unreadable; ask git itself,
+        # running the independent commands side by side
+        commands = (
+            ['git', 'branch', '--show-current'],
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            ['git', 'remote', 'get-url', 'origin']
+        )
+        try:
+            with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+                branch, commit, remote = executor.map(
+                    lambda command: subprocess.check_output(command, encoding='utf-8', timeout=2).strip(),
+                    commands
+                )
+            return {'branch': branch, 'commit': commit, 'remote': remote}
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+    
+    def _resolve_git_ref(self, ref: str) -> Optional[str]:
+        """Resolve a ref to its commit via loose refs, then packed-refs"""
+        try:
+            with open(os.path.join('.git', ref), 'r') as f:
+                return f.read().strip()
+        except OSError:
+            pass
+        
+        try:
+            with open('.git/packed-refs', 'r') as f:
+                for line in f:
+                    sha, _, name = line.strip().partition(' ')
+                    if name == ref:
+                        return sha
+        except OSError:
+            pass
+        
+        return None
+    
+    @cached_property
+    def _pyproject(self) -> Dict[str, Any]:
+        """[project] table from pyproject.toml, read once"""
+        try:
+            if _path_exists('pyproject.toml'):
+                with open('pyproject.toml', 'rb') as f:
+                    return tomllib.load(f).get('project', {})
+        except (OSError, tomllib.TOMLDecodeError):
+            pass
+        
+        return {}
+    
     def _generate_app_id(self) -> str:
         """Generate unique app identifier"""
-        if os.getenv('REPL_ID'):
-            return f"replit-{os.getenv('REPL_ID')}"
-        if os.getenv('GITHUB_REPOSITORY'):
-            return f"github-{os.getenv('GITHUB_REPOSITORY').replace('/', '-')}"
-        if os.getenv('VERCEL_URL'):
-            return f"vercel-{os.getenv('VERCEL_URL')}"
-        if os.getenv('HEROKU_APP_NAME'):
-            return f"heroku-{os.getenv('HEROKU_APP_NAME')}"
+        if _ENV.repl_id:
+            return f"replit-{_ENV.repl_id}"
+        if _ENV.github_repository:
+            return f"github-{_ENV.github_repository.replace('/', '-')}"
+        if _ENV.vercel_url:
+            return f"vercel-{_ENV.vercel_url}"
+        if _ENV.heroku_app_name:
+            return f"heroku-{_ENV.heroku_app_name}"
         
         # Try to get from project files
-        try:
-            if os.path.exists('pyproject.toml'):
-                with open('pyproject.toml', 'r') as f:
-                    content = f.read()
-                    if 'name = ' in content:
-                        name = content.split('name = "')[1].split('"')[0]
-                        return f"python-{name}"
-        except:
-            pass
+        name = self._pyproject.get('name')
+        if name:
+            return f"python-{name}"
         
-        return f"host-{socket.gethostname()}"
+        return f"host-{_HOSTNAME}"
     
     def _detect_app_name(self) -> str:
         """Detect application name"""
-        name = (os.getenv('REPL_SLUG') or 
-                os.getenv('GITHUB_REPOSITORY') or 
-                os.getenv('VERCEL_URL') or 
-                os.getenv('HEROKU_APP_NAME'))
+        name = (_ENV.repl_slug or 
+                _ENV.github_repository or 
+                _ENV.vercel_url or 
+                _ENV.heroku_app_name)
         
         if name:
             return name
         
         # Try to get from project files
-        try:
-            if os.path.exists('pyproject.toml'):
-                with open('pyproject.toml', 'r') as f:
-                    content = f.read()
-                    if 'name = ' in content:
-                        return content.split('name = "')[1].split('"')[0]
-        except:
-            pass
-        
-        return 'chittyos-app'
+        return self._pyproject.get('name', 'chittyos-app')
     
     def _detect_version(self) -> str:
         """Detect application version"""
-        try:
-            if os.path.exists('pyproject.toml'):
-                with open('pyproject.toml', 'r') as f:
-                    content = f.read()
-                    if 'version = ' in content:
-                        return content.split('version = "')[1].split('"')[0]
-        except:
-            pass
-        
-        return '1.0.0'
+        return self._pyproject.get('version', '1.0.0')
     
     def _detect_platform(self) -> str:
         """Detect deployment platform"""
-        if os.getenv('REPL_ID'):
+        if _ENV.repl_id:
             return 'replit'
-        if os.getenv('GITHUB_ACTIONS'):
+        if _ENV.github_actions:
             return 'github-actions'
-        if os.getenv('VERCEL'):
+        if _ENV.vercel:
             return 'vercel'
-        if os.getenv('NETLIFY'):
+        if _ENV.netlify:
             return 'netlify'
-        if os.getenv('RENDER'):
+        if _ENV.render:
             return 'render'
-        if os.getenv('HEROKU_APP_NAME'):
+        if _ENV.heroku_app_name:
             return 'heroku'
-        if os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
+        if _ENV.aws_lambda_function_name:
             return 'aws-lambda'
-        if os.getenv('GOOGLE_CLOUD_PROJECT'):
+        if _ENV.google_cloud_project:
             return 'google-cloud'
-        if os.getenv('WEBSITE_INSTANCE_ID'):
+        if _ENV.website_instance_id:
             return 'azure'
         
         return 'unknown'
     
     def _detect_claude_code(self) -> bool:
         """Detect if Claude Code is being used"""
-        return (os.getenv('CLAUDE_CODE') == 'true' or
-                os.path.exists('.claude') or
-                os.path.exists('claude.json') or
-                os.path.exists('CLAUDE.md'))
+        return (_ENV.claude_code == 'true' or
+                _path_exists('.claude') or
+                _path_exists('claude.json') or
+                _path_exists('CLAUDE.md'))
     
     def _detect_chittyos_components(self) -> Dict[str, bool]:
         """Detect which ChittyOS components are present"""
@@ -214,12 +343,36 @@ class ChittyBeacon:
             'chitty_chain': 'chittychain_ledger.py'
         }
         
+        # One directory read covers the top-level files; nested paths still stat
+        try:
+            with os.scandir('.') as entries:
+                top_level = {entry.name for entry in entries}
+        except OSError:
+            top_level = set()
+        
         for component, file_path in component_files.items():
-            components[component] = os.path.exists(file_path)
+            name = file_path.rstrip('/')
+            components[component] = name in top_level if '/' not in name else _path_exists(file_path)
         
         return components
     
-    def _send_beacon(self, data: Dict[str, Any]):
+    @cached_property
+    def _heartbeat_prefix(self) -> bytes:
+        """Encoded invariant heartbeat fields, left open for timestamp and uptime"""
+        return orjson.dumps({
+            'id': self.app_info['id'],
+            'name': self.app_info['name'],
+            'event': 'heartbeat'
+        })[:-1] + b','
+    
+    @staticmethod
+    def _encode_beacon(data: Union[Dict[str, Any], bytes]) -> bytes:
+        """Encode queued beacon data; heartbeats arrive already encoded"""
+        if isinstance(data, bytes):
+            return data
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    
+    def _send_beacon(self, data: Union[Dict[str, Any], bytes]):
         """Send beacon data to tracking endpoint"""
         if not self.config['enabled']:
             if self.config['verbose']:
@@ -227,34 +380,114 @@ class ChittyBeacon:
             return
         
         try:
-            url = f"{self.config['endpoint']}/track"
-            headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'ChittyBeacon-Python/1.0.0'
-            }
-            
-            response = requests.post(url, json=data, headers=headers, timeout=10)
+            # orjson emits bytes directly; the pool already sends the JSON content type
+            body = self._encode_beacon(data)
+            response = self._http.request('POST', self._track_url, body=body)
             
-            if self.config['verbose'] and response.status_code != 200:
-                self._log(f"Response: {response.status_code}")
+            if self.config['verbose'] and response.status != 200:
+                self._log(f"Response: {response.status}")
                 
         except Exception as e:
             if self.config['verbose']:
                 self._log(f"Error: {e}")
     
+    def _send_batch(self, batch: List[Union[Dict[str, Any], bytes]]):
+        """Send several beacons as one gzipped request"""
+        if len(batch) == 1:
+            self._send_beacon(batch[0])
+            return
+        
+        try:
+            body = gzip.compress(b'[' + b','.join(map(self._encode_beacon, batch)) + b']')
+            response = self._http.request('POST', self._batch_url, body=body,
+                                          headers={**self._headers, 'Content-Encoding': 'gzip'})
+            
+            if self.config['verbose'] and response.status != 200:
+                self._log(f"Batch response: {response.status}")
+                
+        except Exception as e:
+            if self.config['verbose']:
+                self._log(f"Batch error: {e}")
+    
+    def _enqueue(self, data: Union[Dict[str, Any], bytes]):
+        """Queue beacon data for the background sender"""
+        if not self.config['enabled']:
+            self._send_beacon(data)  # Only logs when disabled
+            return
+        self._queue.put_nowait(data)
+    
+    def _run_sender(self):
+        """Drain queued beacons so HTTP posts never block the caller"""
+        while True:
+            # Collect whatever else arrives within the batch interval after the first beacon
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.config['batch_interval']
+            while len(batch) < self.config['batch_size']:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._send_batch(batch)
+    
+    def _flush(self):
+        """Send anything still queued, on the calling thread"""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._send_batch(batch)
+    
+    def _elect_leader(self) -> bool:
+        """Take a per-app lock so only one process on the host tracks lifecycle events"""
+        if fcntl is None:
+            return True
+        
+        path = os.path.join(tempfile.gettempdir(), f"chitty-beacon-{self._generate_app_id()}.lock")
+        try:
+            # Shared temp dir: refuse a planted symlink and keep the lock file private
+            fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        except OSError:
+            return False
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._leader_lock = fd
+        return True
+    
     def _initialize(self):
         """Initialize beacon tracking"""
+        # Start background sender
+        self._sender = threading.Thread(target=self._run_sender, name='chitty-beacon-sender', daemon=True)
+        self._sender.start()
+        
+        # Under multi-worker servers every worker imports the beacon; only the
+        # lock holder detects the app and sends startup, heartbeat and shutdown
+        self._leader = self._elect_leader()
+        if not self._leader:
+            self.app_info = {'id': self._generate_app_id(), 'name': self._detect_app_name()}
+            atexit.register(self._flush)
+            return
+        
         self.app_info = self._detect_app()
         
         # Send initial beacon
-        self._send_beacon({
+        self._enqueue({
             **self.app_info,
             'event': 'startup',
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _utc_now_iso()
         })
         
-        # Start heartbeat timer
-        self._start_heartbeat()
+        # Start heartbeat thread
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name='chitty-beacon-heartbeat', daemon=True)
+        self._heartbeat_thread.start()
         
         # Register shutdown handlers
         atexit.register(self._shutdown)
@@ -263,41 +496,29 @@ class ChittyBeacon:
         
         self._log(f"Tracking {self.app_info['name']} on {self.app_info['platform']}")
     
-    def _start_heartbeat(self):
-        """Start periodic heartbeat"""
-        def heartbeat():
-            self._send_beacon({
-                'id': self.app_info['id'],
-                'name': self.app_info['name'],
-                'event': 'heartbeat',
-                'timestamp': datetime.utcnow().isoformat(),
-                'uptime': time.time() - self.start_time
-            })
-            
-            # Schedule next heartbeat
-            if self.config['enabled']:
-                self.heartbeat_timer = threading.Timer(self.config['interval'], heartbeat)
-                self.heartbeat_timer.daemon = True
-                self.heartbeat_timer.start()
-        
-        # Start first heartbeat
-        self.heartbeat_timer = threading.Timer(self.config['interval'], heartbeat)
-        self.heartbeat_timer.daemon = True
-        self.heartbeat_timer.start()
+    def _heartbeat_loop(self):
+        """Send a heartbeat every interval until shutdown"""
+        while not self._stop.wait(self.config['interval']):
+            self._enqueue(self._heartbeat_prefix + orjson.dumps({
+                'timestamp': _utc_now_iso(),
+                'uptime': time.monotonic() - self._started
+            })[1:])
     
     def _shutdown(self):
         """Send shutdown beacon"""
-        if self.heartbeat_timer:
-            self.heartbeat_timer.cancel()
+        self._stop.set()
+        self._flush()
         
-        if self.app_info:
+        if self._leader:
             self._send_beacon({
                 'id': self.app_info['id'],
                 'name': self.app_info['name'],
                 'event': 'shutdown',
-                'timestamp': datetime.utcnow().isoformat(),
-                'uptime': time.time() - self.start_time
+                'timestamp': _utc_now_iso(),
+                'uptime': time.monotonic() - self._started
             })
+        
+        self._http.clear()
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
@@ -310,13 +531,13 @@ class ChittyBeacon:
             'id': self.app_info['id'] if self.app_info else 'unknown',
             'name': self.app_info['name'] if self.app_info else 'unknown',
             'event': event_type,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _utc_now_iso()
         }
         
         if data:
             beacon_data.update(data)
         
-        self._send_beacon(beacon_data)
+        self._enqueue(beacon_data)
 
 # Global beacon instance
 _beacon_instance = None
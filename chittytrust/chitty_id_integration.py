@@ -5,14 +5,50 @@ Ensures proper Chitty Score™ calculation and distribution
 """
 
 import hashlib
+import math
 import time
 import uuid
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 
+# ChittyID format: CH-YEAR-VER-SEQUENCE-CODE
+CHITTY_ID_PATTERN = re.compile(r'^CH-(\d{4})-VER-([A-Z0-9]{6})-([A-Z0-9]+)$')
+
+CHITTY_ID_VERTICALS = {
+    'A': 'user',
+    'B': 'business', 
+    'O': 'organization',
+    'G': 'government',
+    'AI': 'ai_agent'
+}
+
+@lru_cache(maxsize=4096)
+def _split_chitty_id(chitty_id: str) -> Optional[Tuple[int, str, str]]:
+    """Match a ChittyID once, returning (year, sequence, vertical_code) or None"""
+    match = CHITTY_ID_PATTERN.match(chitty_id)
+    if not match:
+        return None
+    year, sequence, code = match.groups()
+    return int(year), sequence, code
+
+def _valid_chitty_id_year(year: int) -> bool:
+    """Check a ChittyID year is between 2020 and next year"""
+    return 2020 <= year <= datetime.now().year + 1
+
+# Chitty Score™ weights per trust dimension - justice and outcomes dominate,
+# the remaining 10% is split evenly across temporal, channel and network
+CHITTY_SCORE_DIMENSIONS = ('source', 'temporal', 'channel', 'outcome', 'network', 'justice')
+CHITTY_SCORE_WEIGHTS = (0.2, 0.1 / 3, 0.1 / 3, 0.3, 0.1 / 3, 0.4)
+_CHITTY_SCORE_WEIGHT_VECTOR = np.array(CHITTY_SCORE_WEIGHTS)
+
 class ChittyIDGenerator:
     """ChittyID generation system with trust score integration"""
     
@@ -112,31 +148,18 @@ class ChittyIDGenerator:
 
     def _calculate_initial_chitty_score(self, profile: Dict) -> float:
         """Calculate initial Chitty Score™ - Justice + Outcomes focused"""
-        
-        # Chitty Score™ emphasizes justice and outcomes
-        justice_weight = 0.4
-        outcome_weight = 0.3
-        source_weight = 0.2
-        other_weight = 0.1
-        
-        justice_score = profile['trust_dimensions']['justice']['score']
-        outcome_score = profile['trust_dimensions']['outcome']['score']
-        source_score = profile['trust_dimensions']['source']['score']
-        
-        # Average of remaining dimensions
-        temporal_score = profile['trust_dimensions']['temporal']['score']
-        channel_score = profile['trust_dimensions']['channel']['score']
-        network_score = profile['trust_dimensions']['network']['score']
-        other_avg = (temporal_score + channel_score + network_score) / 3
-        
-        chitty_score = (
-            justice_score * justice_weight +
-            outcome_score * outcome_weight +
-            source_score * source_weight +
-            other_avg * other_weight
+        dimensions = profile['trust_dimensions']
+        chitty_score = math.fsum(
+            dimensions[dimension]['score'] * weight
+            for dimension, weight in zip(CHITTY_SCORE_DIMENSIONS, CHITTY_SCORE_WEIGHTS)
         )
         
         return round(chitty_score * 100, 1)  # Convert to percentage
+    
+    @staticmethod
+    def calculate_chitty_scores_batch(dimension_scores: np.ndarray) -> np.ndarray:
+        """Chitty Scores™ for an (N, 6) array of dimension scores in CHITTY_SCORE_DIMENSIONS order"""
+        return np.round(dimension_scores @ _CHITTY_SCORE_WEIGHT_VECTOR * 100, 1)
 
 class ChittyIDValidator:
     """Validation system for ChittyIDs with trust score verification"""
@@ -145,32 +168,29 @@ class ChittyIDValidator:
     def validate_chitty_id(chitty_id: str) -> Dict:
         """Validate ChittyID format and structure"""
         
-        # ChittyID format: CH-YEAR-VER-SEQUENCE-CODE
-        pattern = r'^CH-(\d{4})-VER-([A-Z0-9]{6})-([A-Z0-9]+)$'
-        match = re.match(pattern, chitty_id)
+        parts = _split_chitty_id(chitty_id)
         
-        if not match:
+        if not parts:
             return {
                 'valid': False,
                 'error': 'Invalid ChittyID format',
                 'expected_format': 'CH-YEAR-VER-SEQUENCE-CODE'
             }
         
-        year, sequence, code = match.groups()
-        current_year = datetime.now().year
+        year, sequence, code = parts
         
         # Validate year range
-        if int(year) < 2020 or int(year) > current_year + 1:
+        if not _valid_chitty_id_year(year):
             return {
                 'valid': False,
                 'error': f'Invalid year: {year}',
-                'valid_range': f'2020-{current_year + 1}'
+                'valid_range': f'2020-{datetime.now().year + 1}'
             }
         
         return {
             'valid': True,
             'chitty_id': chitty_id,
-            'year': int(year),
+            'year': year,
             'sequence': sequence,
             'vertical_code': code,
             'parsed_at': datetime.utcnow().isoformat()
@@ -179,25 +199,19 @@ class ChittyIDValidator:
     @staticmethod
     def parse_chitty_id(chitty_id: str) -> Optional[Dict]:
         """Parse ChittyID into components"""
-        validation = ChittyIDValidator.validate_chitty_id(chitty_id)
+        parts = _split_chitty_id(chitty_id)
         
-        if not validation['valid']:
+        if not parts or not _valid_chitty_id_year(parts[0]):
             return None
         
-        vertical_mapping = {
-            'A': 'user',
-            'B': 'business', 
-            'O': 'organization',
-            'G': 'government',
-            'AI': 'ai_agent'
-        }
+        year, sequence, code = parts
         
         return {
             'chitty_id': chitty_id,
-            'year': validation['year'],
-            'sequence': validation['sequence'],
-            'vertical_code': validation['vertical_code'],
-            'vertical': vertical_mapping.get(validation['vertical_code'], 'unknown'),
+            'year': year,
+            'sequence': sequence,
+            'vertical_code': code,
+            'vertical': CHITTY_ID_VERTICALS.get(code, 'unknown'),
             'timestamp': None,  # Would come from database lookup
             'trust_enabled': True
         }
@@ -207,6 +221,11 @@ class ChittyIDTrustBridge:
     
     def __init__(self, trust_engine_url: str = None):
         self.trust_engine_url = trust_engine_url or "http://localhost:5000"
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=Retry(total=2, backoff_factor=0.2))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['Content-Type'] = 'application/json'
         self.generator = ChittyIDGenerator()
         self.validator = ChittyIDValidator()
         
@@ -233,19 +252,19 @@ class ChittyIDTrustBridge:
         
         try:
             # Call ChittyTrust API for full 6D analysis
-            response = requests.post(
+            response = self.session.post(
                 f"{self.trust_engine_url}/api/trust/calculate",
-                json={
+                data=orjson.dumps({
                     'entity_id': chitty_data['chitty_id'],
                     'entity_type': 'chitty_id_user',
                     'verification_data': verification_data,
                     'events': []  # New identity, no events yet
-                },
+                }),
                 timeout=10
             )
             
             if response.status_code == 200:
-                trust_result = response.json()
+                trust_result = orjson.loads(response.content)
                 
                 # Extract scores with emphasis on Chitty Score™
                 return {
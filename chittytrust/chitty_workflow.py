@@ -12,52 +12,105 @@ Architecture:
 - ChittyChain: Immutable blockchain recording (last)
 """
 import os
-import json
+import hashlib
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import logging
-from sqlalchemy import text
-from app import db
+import math
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
+import orjson
+from cachetools import TTLCache
+from flask import current_app
+from sqlalchemy import Row, bindparam, case, distinct, func, insert, select, text, update
+from models import db
 from models import User, VerificationRequest, TrustHistory
-from chittychain import chittychain_client
+from chittychain import CANONICAL_JSON, chittychain_client, verification_level
 from evidence_integration import evidence_ledger
 
+# Longest a workflow waits for the group commit holding its results
+COMMIT_TIMEOUT = 30
+
+# Largest difference between a stored composite score and its recomputation that still counts as consistent
+SCORE_CONSISTENCY_TOLERANCE = 1e-6
+
+# Number of latest trust history records that temporal trust is measured over
+TEMPORAL_TRUST_WINDOW = int(os.environ.get('TEMPORAL_TRUST_WINDOW', 30))
+
+# Windows larger than this stream scores in chunks; smaller ones are cheaper to fetch in one go
+TEMPORAL_TRUST_STREAM_THRESHOLD = 1000
+
+# Recently read user profiles by ChittyID. Sign-ins update these columns (auth.get_or_create_user)
+# in whichever process serves them, so entries are kept only briefly to bound how stale a
+# profile a workflow can score; trust_score and verification_level are not cached
+_USER_PROFILE_COLUMNS = ('id', 'email', 'first_name', 'last_name', 'profile_image_url')
+_user_profile_cache = TTLCache(maxsize=4096, ttl=5)
+_user_profile_cache_lock = threading.Lock()
+
+def _composite_score(dimensions: Dict) -> float:
+    """Correctly rounded mean of the trust dimensions"""
+    return math.fsum(dimensions.values()) / len(dimensions)
+
 class ChittyWorkflow:
     """Comprehensive workflow for ChittyChain Evidence Ledger operations"""
     
-    def __init__(self):
+    def __init__(self, commit_batch_size: int = 100, commit_window: float = 0.01,
+                 temporal_trust_window: int = TEMPORAL_TRUST_WINDOW):
         self.chittychain_db_url = os.environ.get('CHITTYCHAIN_DB_URL')
         self.workflow_status = {}
+        self.temporal_trust_window = temporal_trust_window
+        # Workflow results from concurrent requests share one COMMIT per window
+        self.commit_batch_size = commit_batch_size
+        self.commit_window = commit_window
+        self._commit_queue = queue.SimpleQueue()
+        self._committer = None
+        self._committer_pid = None  # Process that started the committer; forked children need their own
+        self._committer_lock = threading.Lock()
+        # Evidence ledger HTTP writes overlap with the database update
+        self._evidence_pool = None
+        self._evidence_pool_pid = None  # Executor threads do not survive fork; children build their own
         
     def execute_trust_verification_workflow(self, user_id: str, verification_type: str = 'comprehensive') -> Dict:
         """Execute complete trust verification workflow with evidence recording"""
-        workflow_id = f"workflow_{user_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+        # One timestamp for every step of this run
+        now = datetime.utcnow()
+        workflow_id = f"workflow_{user_id}_{now.strftime('%Y%m%d_%H%M%S')}"
         
         try:
+            # Load the user and their verification aggregates once for every step below
+            user = self._load_user(user_id)
+            stats = self._verification_stats(user) if user else None
+            
             # Step 1: ChittyTrust - Calculate comprehensive trust scores
-            trust_result = self._chitty_trust_calculation(user_id)
+            trust_result = self._chitty_trust_calculation(user_id, user, stats, now)
             if not trust_result['success']:
                 return {'workflow_id': workflow_id, 'status': 'failed', 'error': trust_result['error']}
             
             # Step 2: ChittyVerify - Verify trust calculation integrity (just before ChittyChain)
-            verification_result = self._chitty_verify_process(user_id, trust_result['data'])
+            verification_result = self._chitty_verify_process(user_id, user, stats, trust_result['data'], now)
             if not verification_result['success']:
                 return {'workflow_id': workflow_id, 'status': 'failed', 'error': verification_result['error']}
             
             # Step 3: ChittyChain - Record on blockchain for immutability (final step)
-            blockchain_result = self._chitty_chain_recording(user_id, trust_result['data'], verification_result['verification_hash'])
+            blockchain_result = self._chitty_chain_recording(user_id, trust_result['data'], verification_result['verification_hash'], now)
             
-            # Step 4: Evidence Ledger - Document complete workflow
-            evidence_result = self._evidence_ledger_documentation(
+            # Step 4: Evidence Ledger - Document complete workflow on a worker thread...
+            evidence_future = self._evidence_executor().submit(
+                self._evidence_ledger_documentation,
                 workflow_id, 
                 user_id, 
                 trust_result['data'], 
                 verification_result, 
-                blockchain_result
+                blockchain_result,
+                now
             )
             
-            # Step 5: Update database with workflow completion
-            self._update_database_records(user_id, trust_result['data'], blockchain_result['transaction_id'])
+            # Step 5: ...while the database is updated on this thread, which owns the scoped session
+            self._update_database_records(user, trust_result['data'], blockchain_result['transaction_id'], now)
+            evidence_result = evidence_future.result()
             
             return {
                 'workflow_id': workflow_id,
@@ -74,30 +127,52 @@ class ChittyWorkflow:
             logging.error(f"Workflow execution failed: {e}")
             return {'workflow_id': workflow_id, 'status': 'failed', 'error': str(e)}
     
-    def _chitty_trust_calculation(self, user_id: str) -> Dict:
+    def _load_user(self, user_id: str) -> Optional[Row]:
+        """Fetch the profile columns the workflow reads for a ChittyID, without ORM hydration"""
+        with _user_profile_cache_lock:
+            profile = _user_profile_cache.get(user_id)
+        if profile is None:
+            users = User.__table__
+            profile = db.session.execute(
+                select(*(users.c[column] for column in _USER_PROFILE_COLUMNS)).where(users.c.chitty_id == user_id)
+            ).first()
+            if profile is not None:
+                with _user_profile_cache_lock:
+                    _user_profile_cache[user_id] = profile
+        return profile
+    
+    def _verification_stats(self, user: User):
+        """Aggregate a user's verification requests in the database in a single query"""
+        return db.session.query(
+            func.count(VerificationRequest.id).label('total'),
+            func.count(case((VerificationRequest.status == 'completed', 1))).label('completed'),
+            func.count(distinct(VerificationRequest.verification_type)).label('type_count'),
+            func.avg(case((VerificationRequest.status == 'completed', VerificationRequest.reward_amount))).label('avg_completed_reward'),
+            func.count(case((VerificationRequest.priority == 'high', 1))).label('high_priority'),
+            func.max(VerificationRequest.created_at).label('latest_created_at')
+        ).filter(VerificationRequest.user_id == user.id).one()
+    
+    def _chitty_trust_calculation(self, user_id: str, user: Optional[User], stats, now: Optional[datetime] = None) -> Dict:
         """ChittyTrust: Calculate 6D trust scores from database records"""
+        now = now or datetime.utcnow()
         try:
-            # Get user from database
-            user = User.query.filter_by(chitty_id=user_id).first()
             if not user:
                 return {'success': False, 'error': f'User {user_id} not found in ChittyChain database'}
             
-            # Get user's verification history with explicit join
-            verifications = VerificationRequest.query.join(User, VerificationRequest.user_id == User.id).filter(User.chitty_id == user_id).all()
-            trust_history = TrustHistory.query.join(User, TrustHistory.user_id == User.id).filter(User.chitty_id == user_id).order_by(TrustHistory.recorded_at.desc()).limit(30).all()
+            trust_history = self._latest_composite_scores(user.id)
             
             # Calculate trust dimensions based on real data
             trust_scores = {
-                'source': self._calculate_source_trust(user, verifications),
+                'source': self._calculate_source_trust(user, stats),
                 'temporal': self._calculate_temporal_trust(trust_history),
-                'channel': self._calculate_channel_trust(verifications),
-                'outcome': self._calculate_outcome_trust(verifications),
+                'channel': self._calculate_channel_trust(stats),
+                'outcome': self._calculate_outcome_trust(stats),
                 'network': self._calculate_network_trust(user),
-                'justice': self._calculate_justice_trust(user, verifications)
+                'justice': self._calculate_justice_trust(user, stats)
             }
             
             # Calculate composite score
-            composite_score = sum(trust_scores.values()) / len(trust_scores)
+            composite_score = _composite_score(trust_scores)
             
             # Calculate ChittyScore™ (justice + outcome weighted)
             chitty_score = (trust_scores['justice'] * 0.4 + trust_scores['outcome'] * 0.3 + composite_score * 0.3)
@@ -113,7 +188,7 @@ class ChittyWorkflow:
                     'state': trust_scores['source']  # Authority focused
                 },
                 'verification_level': self._get_verification_level(composite_score),
-                'calculated_at': datetime.utcnow().isoformat(),
+                'calculated_at': now.isoformat(),
                 'data_source': 'chittychain_database'
             }
             
@@ -123,15 +198,17 @@ class ChittyWorkflow:
             logging.error(f"ChittyTrust calculation failed: {e}")
             return {'success': False, 'error': str(e)}
     
-    def _chitty_verify_process(self, user_id: str, trust_data: Dict) -> Dict:
+    def _chitty_verify_process(self, user_id: str, user: User, stats, trust_data: Dict,
+                               now: Optional[datetime] = None) -> Dict:
         """ChittyVerify: Verify trust calculation integrity and data consistency"""
+        now = now or datetime.utcnow()
         try:
             # Verify data integrity
             integrity_checks = {
                 'data_completeness': self._verify_data_completeness(trust_data),
                 'score_consistency': self._verify_score_consistency(trust_data),
-                'temporal_validity': self._verify_temporal_validity(user_id),
-                'database_consistency': self._verify_database_consistency(user_id),
+                'temporal_validity': self._verify_temporal_validity(stats, now),
+                'database_consistency': self._verify_database_consistency(user),
                 'calculation_accuracy': self._verify_calculation_accuracy(trust_data)
             }
             
@@ -146,7 +223,7 @@ class ChittyWorkflow:
                 'verification_passed': verification_passed,
                 'verification_hash': verification_hash,
                 'integrity_checks': integrity_checks,
-                'verified_at': datetime.utcnow().isoformat(),
+                'verified_at': now.isoformat(),
                 'verifier': 'ChittyVerify_v1.0'
             }
             
@@ -154,8 +231,10 @@ class ChittyWorkflow:
             logging.error(f"ChittyVerify process failed: {e}")
             return {'success': False, 'error': str(e)}
     
-    def _chitty_chain_recording(self, user_id: str, trust_data: Dict, verification_hash: str) -> Dict:
+    def _chitty_chain_recording(self, user_id: str, trust_data: Dict, verification_hash: str,
+                                now: Optional[datetime] = None) -> Dict:
         """ChittyChain: Record verified trust data on blockchain"""
+        now_iso = (now or datetime.utcnow()).isoformat()
         try:
             # Create blockchain record
             blockchain_data = {
@@ -163,7 +242,7 @@ class ChittyWorkflow:
                 'trust_scores': trust_data['scores'],
                 'verification_hash': verification_hash,
                 'workflow_type': 'chitty_integrated_workflow',
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': now_iso
             }
             
             transaction_id = chittychain_client.record_trust_event(
@@ -176,7 +255,7 @@ class ChittyWorkflow:
                 'success': True,
                 'transaction_id': transaction_id,
                 'blockchain_verified': True,
-                'recorded_at': datetime.utcnow().isoformat()
+                'recorded_at': now_iso
             }
             
         except Exception as e:
@@ -184,8 +263,10 @@ class ChittyWorkflow:
             return {'success': False, 'transaction_id': None, 'error': str(e)}
     
     def _evidence_ledger_documentation(self, workflow_id: str, user_id: str, trust_data: Dict, 
-                                     verification_result: Dict, blockchain_result: Dict) -> Dict:
+                                     verification_result: Dict, blockchain_result: Dict,
+                                     now: Optional[datetime] = None) -> Dict:
         """Evidence Ledger: Document complete workflow with all components"""
+        now_iso = (now or datetime.utcnow()).isoformat()
         try:
             # Create comprehensive workflow documentation
             workflow_documentation = {
@@ -197,7 +278,7 @@ class ChittyWorkflow:
                     'chitty_chain': blockchain_result
                 },
                 'workflow_status': 'completed',
-                'execution_time': datetime.utcnow().isoformat(),
+                'execution_time': now_iso,
                 'integrity_verified': verification_result.get('verification_passed', False)
             }
             
@@ -211,57 +292,134 @@ class ChittyWorkflow:
             return {
                 'success': True,
                 'evidence_id': evidence_id,
-                'documented_at': datetime.utcnow().isoformat()
+                'documented_at': now_iso
             }
             
         except Exception as e:
             logging.error(f"Evidence ledger documentation failed: {e}")
             return {'success': False, 'evidence_id': None, 'error': str(e)}
     
-    def _update_database_records(self, user_id: str, trust_data: Dict, blockchain_tx: str):
+    def _update_database_records(self, user: User, trust_data: Dict, blockchain_tx: str,
+                                 now: Optional[datetime] = None):
         """Update ChittyChain database with workflow results"""
         try:
-            # Update user trust score
-            user = User.query.filter_by(chitty_id=user_id).first()
-            if user:
-                user.trust_score = trust_data['scores']['composite']
-                user.chitty_level = trust_data['verification_level']
-                user.last_calculated = datetime.utcnow()
+            dimensions = trust_data['dimensions']
+            scores = trust_data['scores']
+            now = now or datetime.utcnow()
             
             # Create trust history record with all required fields
-            trust_record = TrustHistory()
-            trust_record.user_id = user.id if user else None
-            trust_record.source_trust = trust_data['dimensions']['source']
-            trust_record.temporal_trust = trust_data['dimensions']['temporal'] 
-            trust_record.channel_trust = trust_data['dimensions']['channel']
-            trust_record.outcome_trust = trust_data['dimensions']['outcome']
-            trust_record.network_trust = trust_data['dimensions']['network']
-            trust_record.justice_trust = trust_data['dimensions']['justice']
-            trust_record.composite_score = trust_data['scores']['composite']
-            trust_record.people_score = trust_data['scores']['people']
-            trust_record.legal_score = trust_data['scores']['legal']
-            trust_record.state_score = trust_data['scores']['state']
-            trust_record.chitty_score = trust_data['scores']['chitty']
-            trust_record.trigger_event = 'chitty_workflow_execution'
-            trust_record.calculation_method = 'chitty_integrated_workflow'
-            trust_record.confidence_level = 0.95
-            trust_record.recorded_at = datetime.utcnow()
+            history_row = {
+                'user_id': user.id,
+                'source_trust': dimensions['source'],
+                'temporal_trust': dimensions['temporal'],
+                'channel_trust': dimensions['channel'],
+                'outcome_trust': dimensions['outcome'],
+                'network_trust': dimensions['network'],
+                'justice_trust': dimensions['justice'],
+                'composite_score': scores['composite'],
+                'people_score': scores['people'],
+                'legal_score': scores['legal'],
+                'state_score': scores['state'],
+                'chitty_score': scores['chitty'],
+                'trigger_event': 'chitty_workflow_execution',
+                'calculation_method': 'chitty_integrated_workflow',
+                'confidence_level': 0.95,
+                'recorded_at': now
+            }
             
-            db.session.add(trust_record)
-            db.session.commit()
+            # Wait until the group commit holding this row is durable
+            done = Future()
+            self._ensure_committer()
+            self._commit_queue.put_nowait((history_row, done))
+            done.result(timeout=COMMIT_TIMEOUT)
             
         except Exception as e:
             logging.error(f"Database update failed: {e}")
+    
+    def _evidence_executor(self) -> ThreadPoolExecutor:
+        """Return the evidence thread pool for this process, creating it after a fork"""
+        if self._evidence_pool_pid == os.getpid():
+            return self._evidence_pool
+        with self._committer_lock:
+            if self._evidence_pool_pid != os.getpid():
+                self._evidence_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='chitty-evidence')
+                self._evidence_pool_pid = os.getpid()
+        return self._evidence_pool
+    
+    def _ensure_committer(self):
+        """Start the group-commit thread, bound to the current app, if this process has no live one"""
+        if self._committer_pid == os.getpid() and self._committer.is_alive():
+            return
+        with self._committer_lock:
+            if self._committer_pid != os.getpid():
+                # A forked child inherits the parent's queue but not its thread
+                self._commit_queue = queue.SimpleQueue()
+                self._committer = None
+            if self._committer is None or not self._committer.is_alive():
+                self._committer_pid = os.getpid()
+                self._committer = threading.Thread(
+                    target=self._run_committer,
+                    args=(current_app._get_current_object(),),
+                    name='chitty-workflow-committer',
+                    daemon=True
+                )
+                self._committer.start()
+    
+    def _run_committer(self, app):
+        """Commit queued workflow results from every request thread in shared transactions"""
+        while True:
+            # Collect whatever else arrives within the commit window after the first result
+            batch = [self._commit_queue.get()]
+            deadline = time.monotonic() + self.commit_window
+            while len(batch) < self.commit_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._commit_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                with app.app_context():
+                    self._commit_batch(batch)
+            except Exception as e:
+                # Never leave a caller waiting on a result the committer could not write
+                logging.error(f"Workflow group commit failed: {e}")
+                for _, done in batch:
+                    if not done.done():
+                        done.set_exception(e)
+    
+    def _commit_batch(self, batch: List[Tuple[Dict, Future]]):
+        """Write a batch of workflow results in one transaction and resolve their futures"""
+        rows = [row for row, _ in batch]
+        try:
+            # Core executemany statements skip ORM unit-of-work bookkeeping for these write-only rows
+            users = User.__table__
+            db.session.execute(
+                update(users).where(users.c.id == bindparam('b_user_id')).values(
+                    trust_score=bindparam('b_trust_score'),
+                    updated_at=bindparam('b_updated_at')
+                ),
+                [{'b_user_id': row['user_id'], 'b_trust_score': row['composite_score'],
+                  'b_updated_at': row['recorded_at']} for row in rows]
+            )
+            db.session.execute(insert(TrustHistory.__table__), rows)
+            db.session.commit()
+        except Exception as e:
             db.session.rollback()
+            for _, done in batch:
+                done.set_exception(e)
+        else:
+            for _, done in batch:
+                done.set_result(None)
     
     # Trust calculation methods using real database data
-    def _calculate_source_trust(self, user: User, verifications: List) -> float:
+    def _calculate_source_trust(self, user: User, stats) -> float:
         """Calculate source trust based on verification completions"""
-        if not verifications:
+        if not stats.total:
             return 50.0
         
-        completed_verifications = len([v for v in verifications if v.status == 'completed'])
-        verification_success_rate = completed_verifications / len(verifications) if verifications else 0
+        verification_success_rate = stats.completed / stats.total
         
         # Base score + success rate bonus
         base_score = 60.0 if user.email else 40.0
@@ -269,43 +427,66 @@ class ChittyWorkflow:
         
         return min(100.0, base_score + success_bonus)
     
-    def _calculate_temporal_trust(self, trust_history: List) -> float:
+    def _latest_composite_scores(self, user_id: str) -> Iterable[Optional[float]]:
+        """Read a user's latest composite scores, streaming them when the window is large"""
+        query = (
+            select(TrustHistory.composite_score)
+            .where(TrustHistory.user_id == user_id)
+            .order_by(TrustHistory.recorded_at.desc())
+            .limit(self.temporal_trust_window)
+        )
+        if self.temporal_trust_window > TEMPORAL_TRUST_STREAM_THRESHOLD:
+            query = query.execution_options(yield_per=100)
+        return db.session.execute(query).scalars()
+    
+    def _calculate_temporal_trust(self, composite_scores: Iterable[Optional[float]]) -> float:
         """Calculate temporal trust based on consistency over time"""
-        if not trust_history:
+        # Single pass with Welford's algorithm so streamed scores are never held in memory
+        rows = 0
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for score in composite_scores:
+            rows += 1
+            if score is None:
+                continue
+            count += 1
+            delta = score - mean
+            mean += delta / count
+            m2 += delta * (score - mean)
+        
+        if not rows:
             return 50.0
         
         # Analyze trust score consistency
-        scores = [h.composite_score for h in trust_history if h.composite_score is not None]
-        if len(scores) < 2:
+        if count < 2:
             return 65.0
         
         # Calculate variance (lower variance = higher temporal trust)
-        variance = sum((score - sum(scores)/len(scores))**2 for score in scores) / len(scores)
+        variance = m2 / count
         consistency_score = max(0, 100 - (variance * 2))
         
         return min(100.0, consistency_score)
     
-    def _calculate_channel_trust(self, verifications: List) -> float:
+    def _calculate_channel_trust(self, stats) -> float:
         """Calculate channel trust based on verification types diversity"""
-        if not verifications:
+        if not stats.total:
             return 45.0
         
-        unique_types = set(v.verification_type for v in verifications)
-        diversity_score = min(100.0, len(unique_types) * 20.0)
+        diversity_score = min(100.0, stats.type_count * 20.0)
         
         return max(45.0, diversity_score)
     
-    def _calculate_outcome_trust(self, verifications: List) -> float:
+    def _calculate_outcome_trust(self, stats) -> float:
         """Calculate outcome trust based on positive verification results"""
-        if not verifications:
+        if not stats.total:
             return 50.0
         
-        completed = [v for v in verifications if v.status == 'completed']
-        if not completed:
+        if not stats.completed:
             return 55.0
         
         # Higher reward verifications indicate better outcomes
-        avg_reward = sum(v.reward_amount for v in completed) / len(completed)
+        avg_reward = float(stats.avg_completed_reward)
         outcome_score = min(100.0, 50.0 + (avg_reward / 10.0))
         
         return outcome_score
@@ -313,26 +494,18 @@ class ChittyWorkflow:
     def _calculate_network_trust(self, user: User) -> float:
         """Calculate network trust based on connections and referrals"""
         # For now, base on user profile completeness
-        profile_completeness = 0
-        if user.first_name:
-            profile_completeness += 20
-        if user.last_name:
-            profile_completeness += 20
-        if user.email:
-            profile_completeness += 30
-        if user.profile_image_url:
-            profile_completeness += 30
+        profile_completeness = (20 * bool(user.first_name) + 20 * bool(user.last_name)
+                                + 30 * bool(user.email) + 30 * bool(user.profile_image_url))
         
         return min(100.0, profile_completeness + 20.0)  # Base network bonus
     
-    def _calculate_justice_trust(self, user: User, verifications: List) -> float:
+    def _calculate_justice_trust(self, user: User, stats) -> float:
         """Calculate justice trust based on fair and ethical behavior"""
         base_justice = 70.0  # Base assumption of justice
         
         # Positive indicators
-        if verifications:
-            high_priority_help = len([v for v in verifications if v.priority == 'high'])
-            community_bonus = min(20.0, high_priority_help * 5.0)
+        if stats.total:
+            community_bonus = min(20.0, stats.high_priority * 5.0)
             base_justice += community_bonus
         
         return min(100.0, base_justice)
@@ -351,28 +524,20 @@ class ChittyWorkflow:
         if not dimensions:
             return False
         
-        expected_composite = sum(dimensions.values()) / len(dimensions)
-        return abs(composite - expected_composite) < 1.0  # Allow small floating point differences
+        # Recompute independently of _composite_score; the two summation orders may differ by rounding
+        expected_composite = float(np.mean(list(dimensions.values())))
+        return math.isclose(composite, expected_composite, abs_tol=SCORE_CONSISTENCY_TOLERANCE)
     
-    def _verify_temporal_validity(self, user_id: str) -> bool:
+    def _verify_temporal_validity(self, stats, now: Optional[datetime] = None) -> bool:
         """Verify data is temporally valid"""
         # Check if calculation is based on recent data
-        cutoff_date = datetime.utcnow() - timedelta(days=90)
-        
-        recent_activity = VerificationRequest.query.join(User, VerificationRequest.user_id == User.id).filter(
-            User.chitty_id == user_id,
-            VerificationRequest.created_at >= cutoff_date
-        ).first()
+        cutoff_date = (now or datetime.utcnow()) - timedelta(days=90)
         
-        return recent_activity is not None
+        return stats.latest_created_at is not None and stats.latest_created_at >= cutoff_date
     
-    def _verify_database_consistency(self, user_id: str) -> bool:
+    def _verify_database_consistency(self, user: Optional[User]) -> bool:
         """Verify data consistency in ChittyChain database"""
-        try:
-            user = User.query.filter_by(chitty_id=user_id).first()
-            return user is not None
-        except Exception:
-            return False
+        return user is not None
     
     def _verify_calculation_accuracy(self, trust_data: Dict) -> bool:
         """Verify calculation accuracy"""
@@ -389,22 +554,14 @@ class ChittyWorkflow:
     
     def _generate_verification_hash(self, user_id: str, trust_data: Dict, integrity_checks: Dict) -> str:
         """Generate cryptographic verification hash"""
-        import hashlib
-        combined_data = f"{user_id}{json.dumps(trust_data, sort_keys=True)}{json.dumps(integrity_checks, sort_keys=True)}"
-        return hashlib.sha256(combined_data.encode()).hexdigest()
+        digest = hashlib.sha256(user_id.encode())
+        digest.update(orjson.dumps(trust_data, option=CANONICAL_JSON))
+        digest.update(orjson.dumps(integrity_checks, option=CANONICAL_JSON))
+        return digest.hexdigest()
     
     def _get_verification_level(self, composite_score: float) -> str:
         """Get verification level based on composite score"""
-        if composite_score >= 90:
-            return 'L4_PLATINUM'
-        elif composite_score >= 80:
-            return 'L3_GOLD'
-        elif composite_score >= 70:
-            return 'L2_SILVER'
-        elif composite_score >= 60:
-            return 'L1_BRONZE'
-        else:
-            return 'L0_UNVERIFIED'
+        return verification_level(composite_score)
 
 # Global workflow instance
 chitty_workflow = ChittyWorkflow()
\ No newline at end of file
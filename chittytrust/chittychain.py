@@ -3,23 +3,47 @@ ChittyChain Blockchain Integration
 Provides immutable trust record storage and cross-platform verification
 """
 import os
-import json
 import hashlib
+from bisect import bisect_right
 from datetime import datetime
 from typing import Dict, List, Optional
-import requests
+import httpx
+import numpy as np
+import orjson
 import logging
 
+# Sorted-key compact JSON used as the canonical form for integrity hashes
+CANONICAL_JSON = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+# Verification levels by composite score; a score at or above
+# VERIFICATION_LEVEL_THRESHOLDS[i] is at least VERIFICATION_LEVELS[i + 1]
+VERIFICATION_LEVEL_THRESHOLDS = (60, 70, 80, 90)
+VERIFICATION_LEVELS = ('L0_UNVERIFIED', 'L1_BRONZE', 'L2_SILVER', 'L3_GOLD', 'L4_PLATINUM')
+_VERIFICATION_LEVEL_ARRAY = np.array(VERIFICATION_LEVELS)
+
+def verification_level(composite_score: float) -> str:
+    """Verification level for a composite score"""
+    return VERIFICATION_LEVELS[bisect_right(VERIFICATION_LEVEL_THRESHOLDS, composite_score)]
+
+def verification_levels(composite_scores: np.ndarray) -> np.ndarray:
+    """Verification levels for an array of composite scores"""
+    return _VERIFICATION_LEVEL_ARRAY[np.searchsorted(VERIFICATION_LEVEL_THRESHOLDS, composite_scores, side='right')]
+
 class ChittyChainClient:
     """Client for ChittyChain blockchain trust verification"""
     
     def __init__(self):
         self.db_url = os.environ.get('CHITTYCHAIN_DB_URL')
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'ChittyTrust/1.0'
-        })
+        # Thread-safe pooled HTTP/2 client shared by every workflow call
+        self.client = httpx.Client(
+            http2=True,
+            headers={
+                'Content-Type': 'application/json',
+                'User-Agent': 'ChittyTrust/1.0'
+            },
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
+            timeout=httpx.Timeout(5.0)
+        )
         
     def record_trust_event(self, user_id: str, event_data: Dict, trust_scores: Dict) -> str:
         """Record a trust event on the blockchain"""
@@ -124,12 +148,14 @@ class ChittyChainClient:
     
     def _generate_verification_hash(self, user_id: str, event_data: Dict, trust_scores: Dict) -> str:
         """Generate verification hash for trust record integrity"""
-        combined_data = f"{user_id}{json.dumps(event_data, sort_keys=True)}{json.dumps(trust_scores, sort_keys=True)}"
-        return hashlib.sha256(combined_data.encode()).hexdigest()
+        digest = hashlib.sha256(user_id.encode())
+        digest.update(orjson.dumps(event_data, option=CANONICAL_JSON))
+        digest.update(orjson.dumps(trust_scores, option=CANONICAL_JSON))
+        return digest.hexdigest()
     
     def _simulate_blockchain_write(self, record: Dict) -> Dict:
         """Simulate writing to blockchain (replace with actual blockchain API)"""
-        transaction_id = f"ctx_{hashlib.sha256(json.dumps(record, sort_keys=True).encode()).hexdigest()[:16]}"
+        transaction_id = f"ctx_{hashlib.sha256(orjson.dumps(record, option=CANONICAL_JSON)).hexdigest()[:16]}"
         
         # In production, this would use actual blockchain API
         return {
@@ -159,20 +185,12 @@ class ChittyChainClient:
     def _simulate_blockchain_query(self, user_id: str, limit: int) -> List[Dict]:
         """Simulate querying blockchain for user records"""
         # In production, this would query actual blockchain
-        records = []
-        for i in range(min(limit, 10)):  # Demo: return up to 10 records
-            records.append({
-                'transaction_id': f"ctx_{user_id}_{i:04d}",
-                'timestamp': datetime.utcnow().isoformat(),
-                'trust_scores': {
-                    'composite': 78.5 + (i * 0.5),
-                    'source': 82.3,
-                    'temporal': 75.8,
-                    'outcome': 84.2,
-                    'justice': 91.7
-                }
-            })
-        return records
+        timestamp = datetime.utcnow().isoformat()
+        return [{
+            'transaction_id': f"ctx_{user_id}_{i:04d}",
+            'timestamp': timestamp,
+            'trust_scores': trust_scores
+        } for i, trust_scores in enumerate(_DEMO_TRUST_SCORES[:max(limit, 0)])]
     
     def _verify_record_integrity(self, record: Dict) -> bool:
         """Verify the integrity of a blockchain record"""
@@ -181,18 +199,16 @@ class ChittyChainClient:
     
     def _calculate_verification_level(self, trust_scores: Dict) -> str:
         """Calculate verification level based on trust scores"""
-        composite = trust_scores.get('composite', 0)
-        
-        if composite >= 90:
-            return 'L4_PLATINUM'
-        elif composite >= 80:
-            return 'L3_GOLD'
-        elif composite >= 70:
-            return 'L2_SILVER'
-        elif composite >= 60:
-            return 'L1_BRONZE'
-        else:
-            return 'L0_UNVERIFIED'
+        return verification_level(trust_scores.get('composite', 0))
+
+# Demo trust scores returned by the simulated blockchain query, newest first
+_DEMO_TRUST_SCORES = tuple({
+    'composite': 78.5 + (i * 0.5),
+    'source': 82.3,
+    'temporal': 75.8,
+    'outcome': 84.2,
+    'justice': 91.7
+} for i in range(10))
 
 # Global ChittyChain client instance
 chittychain_client = ChittyChainClient()
\ No newline at end of file
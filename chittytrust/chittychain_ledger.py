@@ -4,14 +4,21 @@ Enhanced blockchain ledger system with cross-platform compatibility
 Integrates with external ChittyChain Ledger services for distributed trust networks
 """
 import os
-import json
 import hashlib
 import asyncio
+import functools
+import itertools
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union
-import requests
 import logging
+import threading
+import weakref
+from collections import defaultdict, deque
+import httpx
+import orjson
+from cachetools import TTLCache
 from dataclasses import dataclass, asdict, field
+from chittychain import CANONICAL_JSON, verification_level
 
 @dataclass
 class LedgerEntry:
@@ -40,6 +47,30 @@ class TrustPassport:
     issuer: str
     signature: str
 
+# Entry and passport ids are opaque, so they use BLAKE2b; hashes checked on-chain stay SHA-256
+def _short_id(seed: str) -> str:
+    """16 hex character identifier derived from a seed"""
+    return hashlib.blake2b(seed.encode(), digest_size=8).hexdigest()
+
+def _merkle_root(hex_hashes: List[str]) -> str:
+    """SHA-256 Merkle root of hex digests, pairing the last node with itself on odd levels"""
+    level = [bytes.fromhex(hex_hash) for hex_hash in hex_hashes]
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0].hex()
+
+# Users requested per external ledger batch call during sync
+LEDGER_SYNC_BATCH_SIZE = 200
+
+# Ledger entries are anchored on blockchain in batches of up to LEDGER_ANCHOR_BATCH_SIZE,
+# or whatever arrives within LEDGER_ANCHOR_BATCH_INTERVAL seconds of the first entry
+LEDGER_ANCHOR_ACCOUNT = 'chittychain_ledger'
+LEDGER_ANCHOR_BATCH_SIZE = 256
+LEDGER_ANCHOR_BATCH_INTERVAL = 0.2
+LEDGER_ANCHOR_QUEUE_SIZE = 4096
+
 class ChittyChainLedger:
     """Enhanced ChittyChain Ledger with cross-platform integration"""
     
@@ -47,32 +78,68 @@ class ChittyChainLedger:
         self.ledger_url = os.environ.get('CHITTYCHAIN_LEDGER_URL', 'https://a619aa1d-896e-402c-9d4d-d35aa6663444-00-2pfapv5lxqfhn.picard.replit.dev')
         self.local_db_url = os.environ.get('CHITTYCHAIN_DB_URL')
         self.api_key = os.environ.get('CHITTYCHAIN_API_KEY')
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.api_key}' if self.api_key else '',
             'User-Agent': 'ChittyTrust-Ledger/2.0'
-        })
+        }
+        self._clients = weakref.WeakKeyDictionary()  # Pooled HTTP client per event loop
         self.local_cache = {}  # Local cache for performance
+        self._local_by_user = defaultdict(lambda: deque(maxlen=10000))  # Cached entries per user, newest first
+        self._pending_blockchain = {}  # Background blockchain writes by entry id
+        self._anchor_queues = weakref.WeakKeyDictionary()  # Blockchain anchoring queue per event loop
+        self._loop_tasks = set()  # Strong references so per-loop background tasks are not garbage collected
+        self._verified_anchors = TTLCache(maxsize=10000, ttl=3600)  # Anchors already confirmed on ChittyChain
+        self._verified_anchors_lock = threading.Lock()
+        self.sync_concurrency = int(os.environ.get('CHITTYCHAIN_SYNC_CONCURRENCY', 50))
         self.external_ledgers = [
             'https://a619aa1d-896e-402c-9d4d-d35aa6663444-00-2pfapv5lxqfhn.picard.replit.dev'
         ]
         
+    def _client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP/2 client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=True,
+                headers=self.headers,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60),
+                timeout=httpx.Timeout(5.0)
+            )
+            self._clients[loop] = client
+            self._start_loop_task(loop, self._close_client_at_shutdown(client))
+        return client
+    
+    def _start_loop_task(self, loop: asyncio.AbstractEventLoop, coro):
+        """Run a background task for the life of an event loop"""
+        task = loop.create_task(coro)
+        self._loop_tasks.add(task)
+        task.add_done_callback(self._loop_tasks.discard)
+    
+    async def _close_client_at_shutdown(self, client: httpx.AsyncClient):
+        """Hold a loop's HTTP client open until the loop cancels its tasks on shutdown, then close it"""
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await client.aclose()
+    
     async def create_ledger_entry(self, user_id: str, event_type: str, trust_scores: Dict, 
                                 event_data: Dict = None, cross_platform_refs: List[str] = None) -> Optional[str]:
         """Create a new entry in the ChittyChain Ledger"""
         try:
             # Generate unique entry ID
-            entry_id = f"cle_{hashlib.sha256(f'{user_id}{datetime.utcnow().isoformat()}'.encode()).hexdigest()[:16]}"
+            timestamp = datetime.utcnow().isoformat()
+            entry_id = f"cle_{_short_id(f'{user_id}{timestamp}')}"
             
-            # Create verification hash
-            verification_hash = self._generate_verification_hash(user_id, event_type, trust_scores, event_data)
+            # Create verification hash over the same timestamp the entry records
+            verification_hash = self._generate_verification_hash(user_id, event_type, trust_scores, event_data, timestamp)
             
             # Build ledger entry
             entry = LedgerEntry(
                 entry_id=entry_id,
                 user_id=user_id,
-                timestamp=datetime.utcnow().isoformat(),
+                timestamp=timestamp,
                 event_type=event_type,
                 trust_scores=trust_scores,
                 verification_hash=verification_hash,
@@ -80,14 +147,18 @@ class ChittyChainLedger:
                 metadata=event_data or {}
             )
             
-            # Record on blockchain first
-            blockchain_tx = await self._record_on_blockchain(entry)
-            entry.blockchain_tx = blockchain_tx
-            
             # Record in distributed ledger
-            ledger_response = await self._record_in_distributed_ledger(entry)
+            evidence_id = await self._record_in_distributed_ledger(entry)
+            
+            # Anchor on blockchain in the background with other recent entries, even if the evidence
+            # write failed; the cached entry is patched with the transaction once it lands and callers
+            # can await it via wait_for_blockchain_tx
+            anchored = asyncio.get_running_loop().create_future()
+            self._pending_blockchain[entry_id] = anchored
+            anchored.add_done_callback(functools.partial(self._patch_blockchain_tx, entry_id))
+            await self._anchor_queue().put((entry, evidence_id, anchored))
             
-            if ledger_response:
+            if evidence_id:
                 logging.info(f"Ledger entry created: {entry_id}")
                 return entry_id
             
@@ -97,17 +168,36 @@ class ChittyChainLedger:
             logging.error(f"Ledger entry creation failed: {e}")
             return None
     
+    async def wait_for_blockchain_tx(self, entry_id: str) -> Optional[str]:
+        """Wait for an entry's background blockchain write and return its transaction"""
+        anchored = self._pending_blockchain.get(entry_id)
+        if anchored is not None:
+            return await asyncio.shield(anchored)
+        return self.local_cache.get(entry_id, {}).get('blockchain_tx')
+    
+    def _patch_blockchain_tx(self, entry_id: str, anchored: asyncio.Future):
+        """Store a finished background blockchain write on the cached entry"""
+        self._pending_blockchain.pop(entry_id, None)
+        if anchored.cancelled():
+            return
+        blockchain_tx = anchored.result()
+        cached_entry = self.local_cache.get(entry_id)
+        if blockchain_tx and cached_entry is not None:
+            cached_entry['blockchain_tx'] = blockchain_tx
+    
     async def get_user_ledger_history(self, user_id: str, limit: int = 100, 
                                     include_cross_platform: bool = True) -> List[Dict]:
         """Get complete ledger history for a user across all platforms"""
         try:
-            # Query local ledger
-            local_history = await self._query_local_ledger(user_id, limit)
-            
-            # Query distributed ledger if enabled
-            distributed_history = []
+            # Query local ledger, and the distributed ledger alongside it if enabled
             if include_cross_platform:
-                distributed_history = await self._query_distributed_ledger(user_id, limit)
+                local_history, distributed_history = await asyncio.gather(
+                    self._query_local_ledger(user_id, limit),
+                    self._query_distributed_ledger(user_id, limit)
+                )
+            else:
+                local_history = await self._query_local_ledger(user_id, limit)
+                distributed_history = []
             
             # Merge and deduplicate histories
             all_history = self._merge_ledger_histories(local_history, distributed_history)
@@ -135,17 +225,19 @@ class ChittyChainLedger:
             verification_level = self._calculate_verification_level(current_scores)
             
             # Collect blockchain anchors
-            blockchain_anchors = [entry.get('blockchain_tx') for entry in history 
-                                if entry.get('blockchain_tx')][:10]  # Latest 10 anchors
+            # Entries anchored in the same batch share a transaction
+            blockchain_anchors = list(dict.fromkeys(entry.get('blockchain_tx') for entry in history 
+                                                    if entry.get('blockchain_tx')))[:10]  # Latest 10 anchors
             
             # Generate passport
-            passport_id = f"ctp_v2_{hashlib.sha256(f'{user_id}{datetime.utcnow().isoformat()}'.encode()).hexdigest()[:16]}"
-            expires_at = (datetime.utcnow() + timedelta(days=validity_days)).isoformat()
+            issued_at = datetime.utcnow()
+            passport_id = f"ctp_v2_{_short_id(f'{user_id}{issued_at.isoformat()}')}"
+            expires_at = (issued_at + timedelta(days=validity_days)).isoformat()
             
             passport = TrustPassport(
                 passport_id=passport_id,
                 user_id=user_id,
-                issued_at=datetime.utcnow().isoformat(),
+                issued_at=issued_at.isoformat(),
                 expires_at=expires_at,
                 current_scores=current_scores,
                 verification_level=verification_level,
@@ -227,25 +319,24 @@ class ChittyChainLedger:
             # Sync specified users or get active users
             users_to_sync = sync_user_ids or await self._get_active_users()
             
-            for user_id in users_to_sync:
-                try:
-                    # Get external user data
-                    external_data = await self._fetch_external_user_data(external_ledger_url, user_id)
-                    
-                    if external_data:
-                        # Merge with local data
-                        merge_result = await self._merge_user_data(user_id, external_data)
-                        
-                        if merge_result.get('success'):
-                            sync_results['synchronized_users'] += 1
-                            sync_results['new_entries'] += merge_result.get('new_entries', 0)
-                        
-                        if merge_result.get('conflicts'):
-                            sync_results['verification_conflicts'] += len(merge_result['conflicts'])
-                            
-                except Exception as user_sync_error:
-                    logging.warning(f"User {user_id} sync failed: {user_sync_error}")
+            # Sync users in batches concurrently, with at most sync_concurrency requests in flight
+            semaphore = asyncio.Semaphore(self.sync_concurrency)
+            batches = [users_to_sync[i:i + LEDGER_SYNC_BATCH_SIZE]
+                       for i in range(0, len(users_to_sync), LEDGER_SYNC_BATCH_SIZE)]
+            batch_results = await asyncio.gather(
+                *(self._sync_user_batch(external_ledger_url, user_ids, semaphore) for user_ids in batches)
+            )
+            
+            for merge_result in itertools.chain.from_iterable(batch_results):
+                if not merge_result:
                     continue
+                
+                if merge_result.get('success'):
+                    sync_results['synchronized_users'] += 1
+                    sync_results['new_entries'] += merge_result.get('new_entries', 0)
+                
+                if merge_result.get('conflicts'):
+                    sync_results['verification_conflicts'] += len(merge_result['conflicts'])
             
             logging.info(f"Ledger sync completed: {sync_results}")
             return {'success': True, 'results': sync_results}
@@ -254,6 +345,42 @@ class ChittyChainLedger:
             logging.error(f"External ledger sync failed: {e}")
             return {'error': str(e)}
     
+    async def _sync_user_batch(self, external_ledger_url: str, user_ids: List[str],
+                               semaphore: asyncio.Semaphore) -> List[Optional[Dict]]:
+        """Fetch a batch of users' external ledger data in one request and merge each"""
+        async with semaphore:
+            external_users = await self._fetch_external_user_data_batch(external_ledger_url, user_ids)
+        
+        if external_users is None:
+            # The external ledger has no batch endpoint; fall back to one request per user
+            return await asyncio.gather(
+                *(self._sync_user(external_ledger_url, user_id, semaphore) for user_id in user_ids)
+            )
+        
+        return await asyncio.gather(
+            *(self._merge_external_user(user_id, external_users.get(user_id)) for user_id in user_ids)
+        )
+    
+    async def _sync_user(self, external_ledger_url: str, user_id: str,
+                         semaphore: asyncio.Semaphore) -> Optional[Dict]:
+        """Fetch and merge one user's external ledger data"""
+        async with semaphore:
+            # Get external user data
+            external_data = await self._fetch_external_user_data(external_ledger_url, user_id)
+        
+        return await self._merge_external_user(user_id, external_data)
+    
+    async def _merge_external_user(self, user_id: str, external_data: Optional[Dict]) -> Optional[Dict]:
+        """Merge one user's external data with local data, if there is any"""
+        if not external_data:
+            return None
+        
+        try:
+            return await self._merge_user_data(user_id, external_data)
+        except Exception as user_sync_error:
+            logging.warning(f"User {user_id} sync failed: {user_sync_error}")
+            return None
+    
     def get_ledger_analytics(self, days_back: int = 30) -> Dict:
         """Get comprehensive ledger analytics"""
         try:
@@ -303,31 +430,34 @@ class ChittyChainLedger:
     # Private helper methods
     
     def _generate_verification_hash(self, user_id: str, event_type: str, 
-                                  trust_scores: Dict, event_data: Dict = None) -> str:
+                                  trust_scores: Dict, event_data: Dict = None,
+                                  timestamp: Optional[str] = None) -> str:
         """Generate verification hash for ledger entry integrity"""
         combined_data = {
             'user_id': user_id,
             'event_type': event_type,
             'trust_scores': trust_scores,
             'event_data': event_data or {},
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': timestamp or datetime.utcnow().isoformat()
         }
-        return hashlib.sha256(json.dumps(combined_data, sort_keys=True).encode()).hexdigest()
+        return hashlib.sha256(orjson.dumps(combined_data, option=CANONICAL_JSON)).hexdigest()
     
-    async def _record_on_blockchain(self, entry: LedgerEntry) -> Optional[str]:
-        """Record entry on blockchain"""
+    async def _record_on_blockchain(self, entries: List[LedgerEntry]) -> Optional[str]:
+        """Anchor a batch of entries on blockchain with one transaction over their Merkle root"""
         try:
             # Use existing ChittyChain client for blockchain operations
             from chittychain import chittychain_client
             
-            blockchain_tx = chittychain_client.record_trust_event(
-                entry.user_id,
+            # Client call is blocking; keep it off the shared event loop
+            blockchain_tx = await asyncio.to_thread(
+                chittychain_client.record_trust_event,
+                LEDGER_ANCHOR_ACCOUNT,
                 {
-                    'event_type': entry.event_type,
-                    'ledger_entry_id': entry.entry_id,
-                    'verification_hash': entry.verification_hash
+                    'event_type': 'ledger_batch_anchor',
+                    'merkle_root': _merkle_root([entry.verification_hash for entry in entries]),
+                    'ledger_entry_ids': [entry.entry_id for entry in entries]
                 },
-                entry.trust_scores
+                {}
             )
             
             return blockchain_tx
@@ -336,8 +466,59 @@ class ChittyChainLedger:
             logging.error(f"Blockchain recording failed: {e}")
             return None
     
-    async def _record_in_distributed_ledger(self, entry: LedgerEntry) -> bool:
-        """Record entry in distributed ledger network"""
+    def _anchor_queue(self) -> asyncio.Queue:
+        """Get the blockchain anchoring queue for the running event loop, starting its worker"""
+        loop = asyncio.get_running_loop()
+        anchor_queue = self._anchor_queues.get(loop)
+        if anchor_queue is None:
+            anchor_queue = asyncio.Queue(maxsize=LEDGER_ANCHOR_QUEUE_SIZE)  # Full queue applies backpressure
+            self._anchor_queues[loop] = anchor_queue
+            self._start_loop_task(loop, self._run_anchor_worker(anchor_queue))
+        return anchor_queue
+    
+    async def _run_anchor_worker(self, anchor_queue: asyncio.Queue):
+        """Anchor queued entries in batches so the chain sees one transaction per batch"""
+        loop = asyncio.get_running_loop()
+        while True:
+            # Collect whatever else arrives within the batch interval after the first entry
+            batch = [await anchor_queue.get()]
+            deadline = loop.time() + LEDGER_ANCHOR_BATCH_INTERVAL
+            while len(batch) < LEDGER_ANCHOR_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(anchor_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            blockchain_tx = None
+            try:
+                blockchain_tx = await self._record_on_blockchain([entry for entry, _, _ in batch])
+            except Exception as e:
+                # Keep the worker alive for later batches; waiters see a missing transaction
+                logging.error(f"Blockchain anchoring failed: {e}")
+            finally:
+                for _, _, anchored in batch:
+                    if not anchored.done():
+                        anchored.set_result(blockchain_tx)
+            
+            if blockchain_tx:
+                await self._attach_evidence_blockchain_tx(
+                    [evidence_id for _, evidence_id, _ in batch if evidence_id], blockchain_tx
+                )
+    
+    async def _attach_evidence_blockchain_tx(self, evidence_ids: List[str], blockchain_tx: str):
+        """Add a batch's anchoring transaction to the evidence records written before it existed"""
+        from evidence_integration import evidence_ledger
+        
+        await asyncio.gather(*(
+            asyncio.to_thread(evidence_ledger.attach_blockchain_tx, evidence_id, blockchain_tx)
+            for evidence_id in evidence_ids
+        ))
+    
+    async def _record_in_distributed_ledger(self, entry: LedgerEntry) -> Optional[str]:
+        """Record entry in distributed ledger network, returning its evidence record id"""
         try:
             # In production, this would use actual distributed ledger API
             # For now, record in local cache and Evidence Ledger
@@ -345,7 +526,9 @@ class ChittyChainLedger:
             # Record in Evidence Ledger
             from evidence_integration import evidence_ledger
             
-            evidence_id = evidence_ledger.record_trust_evidence(
+            # Notion writes are blocking HTTP; keep them off the shared event loop
+            evidence_id = await asyncio.to_thread(
+                evidence_ledger.record_trust_evidence,
                 entry.user_id,
                 {
                     'entry_id': entry.entry_id,
@@ -358,21 +541,21 @@ class ChittyChainLedger:
             )
             
             # Cache locally for performance
-            self.local_cache[entry.entry_id] = asdict(entry)
+            cached_entry = asdict(entry)
+            self.local_cache[entry.entry_id] = cached_entry
+            self._local_by_user[entry.user_id].appendleft(cached_entry)
             
-            return bool(evidence_id)
+            return evidence_id
             
         except Exception as e:
             logging.error(f"Distributed ledger recording failed: {e}")
-            return False
+            return None
     
     async def _query_local_ledger(self, user_id: str, limit: int) -> List[Dict]:
         """Query local ledger cache and database"""
         # Implementation would query actual local database
         # For now, return cached entries
-        user_entries = [entry for entry in self.local_cache.values() 
-                       if entry.get('user_id') == user_id]
-        return user_entries[:limit]
+        return list(itertools.islice(self._local_by_user.get(user_id, ()), limit))
     
     async def _query_distributed_ledger(self, user_id: str, limit: int) -> List[Dict]:
         """Query distributed ledger network"""
@@ -380,7 +563,7 @@ class ChittyChainLedger:
             if not self.ledger_url:
                 return []
             
-            response = self.session.get(
+            response = await self._client().get(
                 f"{self.ledger_url}/api/ledger/user/{user_id}",
                 params={'limit': limit},
                 timeout=10
@@ -420,23 +603,13 @@ class ChittyChainLedger:
     
     def _calculate_verification_level(self, trust_scores: Dict) -> str:
         """Calculate verification level from trust scores"""
-        composite = trust_scores.get('composite', 0)
-        
-        if composite >= 90:
-            return 'L4_PLATINUM'
-        elif composite >= 80:
-            return 'L3_GOLD'
-        elif composite >= 70:
-            return 'L2_SILVER'
-        elif composite >= 60:
-            return 'L1_BRONZE'
-        else:
-            return 'L0_UNVERIFIED'
+        return verification_level(trust_scores.get('composite', 0))
     
     def _generate_passport_signature(self, passport_id: str, user_id: str, scores: Dict) -> str:
         """Generate cryptographic signature for passport"""
-        signature_data = f"{passport_id}{user_id}{json.dumps(scores, sort_keys=True)}"
-        return hashlib.sha256(signature_data.encode()).hexdigest()
+        digest = hashlib.sha256(f"{passport_id}{user_id}".encode())
+        digest.update(orjson.dumps(scores, option=CANONICAL_JSON))
+        return digest.hexdigest()
     
     async def _verify_local_passport(self, passport_id: str) -> Dict:
         """Verify passport in local ledger"""
@@ -460,20 +633,29 @@ class ChittyChainLedger:
         except Exception:
             return None
     
+    def _verify_anchor(self, anchor: str) -> bool:
+        """Check one blockchain transaction anchor against ChittyChain"""
+        try:
+            from chittychain import chittychain_client
+            return bool(chittychain_client.verify_trust_record(anchor).get('verified'))
+        except Exception:
+            return False
+    
     async def _verify_blockchain_anchors(self, anchors: List[str]) -> Dict:
         """Verify blockchain transaction anchors"""
-        verified_anchors = []
+        # Confirmed anchors stay confirmed, so only unconfirmed ones go back to the chain
+        candidates = anchors[:5]  # Verify up to 5 anchors
+        with self._verified_anchors_lock:
+            unchecked = [anchor for anchor in candidates if anchor not in self._verified_anchors]
         
-        for anchor in anchors[:5]:  # Verify up to 5 anchors
-            try:
-                from chittychain import chittychain_client
-                verification = chittychain_client.verify_trust_record(anchor)
-                
-                if verification.get('verified'):
-                    verified_anchors.append(anchor)
-                    
-            except Exception:
-                continue
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._verify_anchor, anchor) for anchor in unchecked)
+        )
+        with self._verified_anchors_lock:
+            for anchor, verified in zip(unchecked, results):
+                if verified:
+                    self._verified_anchors[anchor] = True
+            verified_anchors = [anchor for anchor in candidates if anchor in self._verified_anchors]
         
         return {
             'total_anchors': len(anchors),
@@ -490,7 +672,7 @@ class ChittyChainLedger:
             
             for endpoint in endpoints:
                 try:
-                    response = self.session.get(f"{ledger_url}{endpoint}", timeout=5)
+                    response = await self._client().get(f"{ledger_url}{endpoint}", timeout=5)
                     if response.status_code == 200:
                         content = response.text.lower()
                         # Check if it's a ChittyChain instance
@@ -518,7 +700,7 @@ class ChittyChainLedger:
     async def _fetch_external_user_data(self, ledger_url: str, user_id: str) -> Optional[Dict]:
         """Fetch user data from external ledger"""
         try:
-            response = self.session.get(
+            response = await self._client().get(
                 f"{ledger_url}/api/ledger/user/{user_id}",
                 timeout=10
             )
@@ -531,6 +713,27 @@ class ChittyChainLedger:
         except Exception:
             return None
     
+    async def _fetch_external_user_data_batch(self, ledger_url: str, user_ids: List[str]) -> Optional[Dict[str, Dict]]:
+        """Fetch several users' data from external ledger in one request; None if unsupported"""
+        try:
+            response = await self._client().post(
+                f"{ledger_url}/api/ledger/users:batch",
+                # Local history only, so ledgers syncing with each other don't fan back out
+                content=orjson.dumps({'user_ids': user_ids, 'limit': 100, 'cross_platform': False}),
+                timeout=10
+            )
+            
+            if response.status_code == 404:
+                return None
+            
+            if response.status_code == 200:
+                return orjson.loads(response.content).get('users', {})
+            
+            return {}
+            
+        except Exception:
+            return {}
+    
     async def _merge_user_data(self, user_id: str, external_data: Dict) -> Dict:
         """Merge external user data with local data"""
         # Implementation would perform intelligent merge
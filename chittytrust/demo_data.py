@@ -3,7 +3,7 @@ Demo data for the three personas.
 """
 
 from datetime import datetime, timedelta
-from typing import Tuple, List, Optional
+from typing import Dict, Iterable, Tuple, List, Optional
 from src.chitty_trust.models import (
     TrustEntity, TrustEvent, Credential, Connection,
     CredentialType, EventType, Outcome
@@ -12,14 +12,17 @@ from src.chitty_trust.models import (
 
 def get_persona_data(persona_id: str) -> Tuple[Optional[TrustEntity], List[TrustEvent]]:
     """Get entity and events for a specific persona."""
-    if persona_id == 'alice':
-        return create_alice_community()
-    elif persona_id == 'bob':
-        return create_bob_business()
-    elif persona_id == 'charlie':
-        return create_charlie_changed()
-    else:
-        return None, []
+    entity, events = _PERSONA_CACHE.get(persona_id, (None, []))
+    return entity, list(events)
+
+
+def get_personas_bulk(persona_ids: Iterable[str]) -> Dict[str, Tuple[TrustEntity, List[TrustEvent]]]:
+    """Get entity and events for each known persona in persona_ids."""
+    return {
+        persona_id: (_PERSONA_CACHE[persona_id][0], list(_PERSONA_CACHE[persona_id][1]))
+        for persona_id in persona_ids
+        if persona_id in _PERSONA_CACHE
+    }
 
 
 def create_alice_community() -> Tuple[TrustEntity, List[TrustEvent]]:
@@ -369,3 +372,13 @@ def create_charlie_changed() -> Tuple[TrustEntity, List[TrustEvent]]:
     ]
     
     return entity, events
+
+
+# Personas are built once at import; get_persona_data hands out a fresh
+# event list each call so callers can't disturb the shared copy
+_PERSONA_BUILDERS = {
+    'alice': create_alice_community,
+    'bob': create_bob_business,
+    'charlie': create_charlie_changed,
+}
+_PERSONA_CACHE = {persona_id: build() for persona_id, build in _PERSONA_BUILDERS.items()}
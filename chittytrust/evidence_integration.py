@@ -6,8 +6,13 @@ import os
 import json
 from datetime import datetime
 from typing import Dict, List, Optional
+import orjson
 import requests
 import logging
+from chittychain import CANONICAL_JSON
+
+# Seconds before a Notion API call is abandoned
+NOTION_REQUEST_TIMEOUT = 10
 
 class EvidenceLedgerIntegration:
     """Integration with the actual ChittyChain Evidence Ledger Notion page"""
@@ -46,6 +51,20 @@ class EvidenceLedgerIntegration:
             logging.error(f"Evidence ledger recording failed: {e}")
             return None
     
+    def attach_blockchain_tx(self, evidence_id: str, blockchain_tx: str) -> bool:
+        """Append the blockchain transaction to an evidence record written before it was anchored"""
+        try:
+            response = self._make_notion_request(
+                'PATCH',
+                f'/blocks/{evidence_id}/children',
+                {'children': [self._build_blockchain_tx_block(blockchain_tx)]}
+            )
+            return bool(response)
+            
+        except Exception as e:
+            logging.error(f"Evidence blockchain TX update failed: {e}")
+            return False
+    
     def create_verification_record(self, verification_id: str, verification_data: Dict, outcome: str) -> Optional[str]:
         """Create verification outcome record in evidence ledger"""
         try:
@@ -174,16 +193,7 @@ class EvidenceLedgerIntegration:
         
         # Add blockchain transaction if available
         if blockchain_tx:
-            blocks.append({
-                'object': 'block',
-                'type': 'paragraph',
-                'paragraph': {
-                    'rich_text': [
-                        {'text': {'content': f'Blockchain TX: '}},
-                        {'text': {'content': blockchain_tx, 'annotations': {'code': True, 'color': 'green'}}}
-                    ]
-                }
-            })
+            blocks.append(self._build_blockchain_tx_block(blockchain_tx))
         
         # Add trust scores
         blocks.append({
@@ -281,6 +291,19 @@ class EvidenceLedgerIntegration:
         
         return blocks
     
+    def _build_blockchain_tx_block(self, blockchain_tx: str) -> Dict:
+        """Build the block recording the blockchain transaction that anchors an evidence record"""
+        return {
+            'object': 'block',
+            'type': 'paragraph',
+            'paragraph': {
+                'rich_text': [
+                    {'text': {'content': f'Blockchain TX: '}},
+                    {'text': {'content': blockchain_tx, 'annotations': {'code': True, 'color': 'green'}}}
+                ]
+            }
+        }
+    
     def _build_verification_blocks(self, verification_id: str, verification_data: Dict, outcome: str) -> List[Dict]:
         """Build verification record blocks"""
         return [
@@ -428,11 +451,11 @@ class EvidenceLedgerIntegration:
             url = f"{self.base_url}{endpoint}"
             
             if method == 'GET':
-                response = requests.get(url, headers=self.headers)
+                response = requests.get(url, headers=self.headers, timeout=NOTION_REQUEST_TIMEOUT)
             elif method == 'POST':
-                response = requests.post(url, headers=self.headers, json=data)
+                response = requests.post(url, headers=self.headers, json=data, timeout=NOTION_REQUEST_TIMEOUT)
             elif method == 'PATCH':
-                response = requests.patch(url, headers=self.headers, json=data)
+                response = requests.patch(url, headers=self.headers, json=data, timeout=NOTION_REQUEST_TIMEOUT)
             else:
                 return None
             
@@ -449,8 +472,10 @@ class EvidenceLedgerIntegration:
     def _generate_evidence_hash(self, user_id: str, trust_data: Dict) -> str:
         """Generate cryptographic hash for evidence integrity"""
         import hashlib
-        combined_data = f"{user_id}{json.dumps(trust_data, sort_keys=True)}{datetime.utcnow().date().isoformat()}"
-        return hashlib.sha256(combined_data.encode()).hexdigest()[:16]
+        digest = hashlib.sha256(user_id.encode())
+        digest.update(orjson.dumps(trust_data, option=CANONICAL_JSON))
+        digest.update(datetime.utcnow().date().isoformat().encode())
+        return digest.hexdigest()[:16]
     
     def _build_integration_snippets_blocks(self, snippets: Dict) -> List[Dict]:
         """Build integration snippets documentation blocks"""
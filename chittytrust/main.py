@@ -1,4 +1,7 @@
+import os
+
 from app import app
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    debug = os.environ.get('FLASK_DEBUG', '0') == '1'
+    app.run(debug=debug, use_reloader=debug, threaded=True, host='0.0.0.0', port=int(os.environ.get('PORT', 5000)))
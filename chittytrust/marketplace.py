@@ -3,7 +3,8 @@ ChittyID Verification Marketplace Logic
 Core marketplace functionality for verification requests and historical tracking
 """
 from datetime import datetime, timedelta
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, select, case
+from sqlalchemy.orm import joinedload
 from models import db, User, VerificationRequest, TrustHistory, VerifierProfile, ChittyCoin
 from src.chitty_trust import calculate_trust
 from demo_data import get_persona_data
@@ -12,6 +13,9 @@ from notion_integration import notion_integration
 import asyncio
 import json
 
+# Verification request statuses that still need verifier attention
+ACTIVE_REQUEST_STATUSES = ('open', 'claimed', 'in_progress')
+
 class MarketplaceService:
     """Service class for marketplace operations"""
     
@@ -40,7 +44,9 @@ class MarketplaceService:
     @staticmethod
     def get_marketplace_requests(limit=20, verification_type=None, status='open'):
         """Get available verification requests"""
-        query = VerificationRequest.query.filter_by(status=status)
+        query = VerificationRequest.query.options(
+            joinedload(VerificationRequest.user)
+        ).filter_by(status=status)
         
         if verification_type:
             query = query.filter_by(verification_type=verification_type)
@@ -67,15 +73,43 @@ class MarketplaceService:
         query = VerificationRequest.query.filter_by(user_id=user_id)
         
         if not include_completed:
-            query = query.filter(VerificationRequest.status.in_(['open', 'claimed', 'in_progress']))
+            query = query.filter(VerificationRequest.status.in_(ACTIVE_REQUEST_STATUSES))
         
         return query.order_by(desc(VerificationRequest.created_at)).all()
     
+    @staticmethod
+    def get_user_request_counts(user_id):
+        """Get total and active verification request counts for a user"""
+        total, active = db.session.query(
+            func.count(VerificationRequest.id),
+            func.sum(case((VerificationRequest.status.in_(ACTIVE_REQUEST_STATUSES), 1), else_=0))
+        ).filter(VerificationRequest.user_id == user_id).one()
+        
+        return total, int(active or 0)
+    
     @staticmethod
     def get_verifier_requests(verifier_id):
         """Get verifier's claimed requests"""
         return VerificationRequest.query.filter_by(verifier_id=verifier_id).order_by(desc(VerificationRequest.claimed_at)).all()
 
+# Columns returned by TrustHistoryService.get_trust_history_columns
+TRUST_HISTORY_COLUMNS = {
+    'recorded_at': TrustHistory.recorded_at,
+    'source': TrustHistory.source_trust,
+    'temporal': TrustHistory.temporal_trust,
+    'channel': TrustHistory.channel_trust,
+    'outcome': TrustHistory.outcome_trust,
+    'network': TrustHistory.network_trust,
+    'justice': TrustHistory.justice_trust,
+    'composite': TrustHistory.composite_score,
+    'people': TrustHistory.people_score,
+    'legal': TrustHistory.legal_score,
+    'state': TrustHistory.state_score,
+    'chitty': TrustHistory.chitty_score,
+    'trigger_event': TrustHistory.trigger_event,
+    'confidence': TrustHistory.confidence_level,
+}
+
 class TrustHistoryService:
     """Service for historical trust tracking"""
     
@@ -116,6 +150,20 @@ class TrustHistoryService:
         
         return query.all()
     
+    @staticmethod
+    def get_trust_history_columns(user_id, days_back=30):
+        """Get trust history for a user as a dict of per-field lists"""
+        cutoff_date = datetime.utcnow() - timedelta(days=days_back)
+        
+        rows = db.session.execute(
+            select(*TRUST_HISTORY_COLUMNS.values())
+            .where(TrustHistory.user_id == user_id, TrustHistory.recorded_at >= cutoff_date)
+            .order_by(TrustHistory.recorded_at)
+        ).all()
+        
+        columns = list(zip(*rows)) or [()] * len(TRUST_HISTORY_COLUMNS)
+        return {name: list(values) for name, values in zip(TRUST_HISTORY_COLUMNS, columns)}
+    
     @staticmethod
     def get_trust_trends(user_id, days_back=7):
         """Get trust trends for visualization"""
@@ -2,6 +2,7 @@
 ChittyID Verification Marketplace Models
 Database models for verification marketplace and historical trust tracking
 """
+import os
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import DeclarativeBase
 from datetime import datetime
@@ -12,6 +13,25 @@ class Base(DeclarativeBase):
 
 db = SQLAlchemy(model_class=Base)
 
+def configure_database(flask_app):
+    """Point a Flask app at DATABASE_URL with the shared pool settings and bind db to it"""
+    flask_app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
+    flask_app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    # Pool sizing is per worker process; recycle stays under Postgres' idle timeout
+    # so stale connections are replaced without a ping on every checkout
+    flask_app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 20)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 40)),
+        "pool_timeout": int(os.environ.get("DB_POOL_TIMEOUT", 10)),
+        "pool_recycle": 280,
+        "pool_pre_ping": False,
+        "connect_args": {
+            "connect_timeout": 5,
+            "application_name": "chittytrust",
+        },
+    }
+    db.init_app(flask_app)
+
 class User(db.Model):
     """User model integrated with Clerk authentication"""
     __tablename__ = 'users'
@@ -25,7 +45,7 @@ class User(db.Model):
     # ChittyID specific fields
     chitty_id = db.Column(db.String(50), unique=True, nullable=True)
     verification_level = db.Column(db.String(20), default='L0')  # L0-L4
-    trust_score = db.Column(db.Float, default=0.0)
+    trust_score = db.Column(db.Float, default=0.0, index=True)
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -65,6 +85,10 @@ class VerificationRequest(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        db.Index('ix_vr_user_status', 'user_id', 'status'),
+    )
+    
     def get_evidence_urls(self):
         return json.loads(self.evidence_urls) if self.evidence_urls else []
     
@@ -0,0 +1,89 @@
+"""
+Tests for the ChittyWorkflow trust calculations
+Run from chittytrust/ with: python -m unittest discover -s tests -t .
+"""
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+import numpy as np
+from flask import Flask
+
+from chitty_workflow import TEMPORAL_TRUST_STREAM_THRESHOLD, ChittyWorkflow, _composite_score
+from models import db, TrustHistory, User
+
+def _trust_history(user_id: str, composite_score: float, recorded_at: datetime) -> TrustHistory:
+    return TrustHistory(
+        user_id=user_id, source_trust=0, temporal_trust=0, channel_trust=0, outcome_trust=0,
+        network_trust=0, justice_trust=0, composite_score=composite_score, people_score=0,
+        legal_score=0, state_score=0, chitty_score=0, recorded_at=recorded_at
+    )
+
+class ScoreConsistencyTest(unittest.TestCase):
+    """Composite score verification"""
+    
+    def setUp(self):
+        self.workflow = ChittyWorkflow()
+        self.dimensions = {'source': 80.0, 'temporal': 65.0, 'channel': 72.5, 'outcome': 90.0,
+                           'network': 60.0, 'justice': 70.1}
+    
+    def test_accepts_calculated_composite(self):
+        composite = _composite_score(self.dimensions)
+        trust_data = {'dimensions': self.dimensions, 'scores': {'composite': composite}}
+        self.assertTrue(self.workflow._verify_score_consistency(trust_data))
+    
+    def test_rejects_mismatched_composite(self):
+        composite = _composite_score(self.dimensions) + 0.5
+        trust_data = {'dimensions': self.dimensions, 'scores': {'composite': composite}}
+        self.assertFalse(self.workflow._verify_score_consistency(trust_data))
+        self.assertFalse(self.workflow._verify_score_consistency({'scores': {'composite': composite}}))
+
+class TemporalTrustTest(unittest.TestCase):
+    """Temporal trust over a user's latest composite scores"""
+    
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        db.init_app(self.app)
+        context = self.app.app_context()
+        context.push()
+        self.addCleanup(context.pop)
+        db.create_all()
+        
+        db.session.add(User(id='user-1', email='user-1@example.com'))
+        start = datetime(2026, 1, 1)
+        self.scores = [50.0 + (i % 7) for i in range(TEMPORAL_TRUST_STREAM_THRESHOLD + 200)]
+        db.session.add_all(
+            _trust_history('user-1', score, start + timedelta(minutes=i)) for i, score in enumerate(self.scores)
+        )
+        db.session.commit()
+    
+    def test_matches_population_variance(self):
+        workflow = ChittyWorkflow()
+        scores = [72.5, 80.0, None, 64.25, 91.0]
+        variance = float(np.var([score for score in scores if score is not None]))
+        
+        self.assertAlmostEqual(workflow._calculate_temporal_trust(scores), max(0, 100 - variance * 2))
+        self.assertEqual(workflow._calculate_temporal_trust([]), 50.0)
+        self.assertEqual(workflow._calculate_temporal_trust([None, 70.0]), 65.0)
+    
+    def test_small_window_is_buffered(self):
+        workflow = ChittyWorkflow(temporal_trust_window=30)
+        with mock.patch.object(db.session, 'execute', wraps=db.session.execute) as execute:
+            scores = list(workflow._latest_composite_scores('user-1'))
+        
+        self.assertNotIn('yield_per', execute.call_args.args[0].get_execution_options())
+        self.assertEqual(scores, self.scores[::-1][:30])
+    
+    def test_large_window_is_streamed(self):
+        window = TEMPORAL_TRUST_STREAM_THRESHOLD + 100
+        workflow = ChittyWorkflow(temporal_trust_window=window)
+        with mock.patch.object(db.session, 'execute', wraps=db.session.execute) as execute:
+            temporal = workflow._calculate_temporal_trust(workflow._latest_composite_scores('user-1'))
+        
+        self.assertEqual(execute.call_args.args[0].get_execution_options()['yield_per'], 100)
+        expected = max(0, 100 - float(np.var(self.scores[::-1][:window])) * 2)
+        self.assertAlmostEqual(temporal, expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Tests for ChittyChain Ledger blockchain anchoring
+Run from chittytrust/ with: python -m unittest discover -s tests -t .
+"""
+import asyncio
+import unittest
+from unittest import mock
+
+from chittychain import chittychain_client
+from chittychain_ledger import ChittyChainLedger
+from evidence_integration import evidence_ledger
+
+class BlockchainAnchoringTest(unittest.IsolatedAsyncioTestCase):
+    """Entries anchored after their evidence record is written"""
+    
+    def setUp(self):
+        self.ledger = ChittyChainLedger()
+        self.notion_requests = []
+        
+        def make_notion_request(method, endpoint, data=None):
+            self.notion_requests.append((method, endpoint, data))
+            return {'id': 'evidence-page-1'}
+        
+        patches = [
+            mock.patch.object(evidence_ledger, '_make_notion_request', side_effect=make_notion_request),
+            mock.patch.object(chittychain_client, 'record_trust_event', return_value='0xanchor')
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    async def test_evidence_record_carries_anchor_tx(self):
+        entry_id = await self.ledger.create_ledger_entry('user-1', 'trust_update', {'composite': 72.5})
+        
+        self.assertIsNotNone(entry_id)
+        self.assertEqual(await asyncio.wait_for(self.ledger.wait_for_blockchain_tx(entry_id), 5), '0xanchor')
+        
+        # The anchoring worker patches the evidence record after resolving waiters
+        for _ in range(100):
+            if len(self.notion_requests) > 1:
+                break
+            await asyncio.sleep(0.01)
+        
+        method, endpoint, data = self.notion_requests[-1]
+        self.assertEqual(method, 'PATCH')
+        self.assertEqual(endpoint, '/blocks/evidence-page-1/children')
+        rich_text = data['children'][0]['paragraph']['rich_text']
+        self.assertEqual(rich_text[1]['text']['content'], '0xanchor')
+        self.assertEqual(self.ledger.local_cache[entry_id]['blockchain_tx'], '0xanchor')
+
+    async def test_entry_anchored_when_evidence_write_fails(self):
+        evidence_ledger._make_notion_request.side_effect = lambda method, endpoint, data=None: None
+        
+        self.assertIsNone(await self.ledger.create_ledger_entry('user-1', 'trust_update', {'composite': 72.5}))
+        
+        entry_id = next(iter(self.ledger.local_cache))
+        self.assertEqual(await asyncio.wait_for(self.ledger.wait_for_blockchain_tx(entry_id), 5), '0xanchor')
+        chittychain_client.record_trust_event.assert_called_once()
+
+class LoopClientTest(unittest.TestCase):
+    """Per-loop HTTP clients"""
+    
+    def test_client_closed_when_loop_shuts_down(self):
+        ledger = ChittyChainLedger()
+        
+        async def open_client():
+            return ledger._client()
+        
+        client = asyncio.run(open_client())
+        self.assertTrue(client.is_closed)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,21 @@
+"""
+ChittyChain Batch Workflow Worker
+Entry point for batch workflow pool processes; binds the database to a bare Flask
+app instead of importing the web app with its beacon, event loop and routes
+"""
+from functools import lru_cache
+from flask import Flask
+from models import configure_database
+
+@lru_cache(maxsize=1)
+def _worker_app():
+    """Flask app holding this worker process's database engine"""
+    worker_app = Flask(__name__)
+    configure_database(worker_app)
+    return worker_app
+
+def run_workflow(user_id):
+    """Execute a single ChittyChain workflow inside a pool worker."""
+    from chitty_workflow import chitty_workflow
+    with _worker_app().app_context():
+        return chitty_workflow.execute_trust_verification_workflow(user_id)